@@ -0,0 +1,16 @@
+# audio_compat.py
+"""
+Makes ``import audioop`` work on Python 3.13+, which removed the module.
+
+None of the pipeline modules use audioop; Gradio does, through pydub, at
+import time. Import this module before gradio so audioop-lts is registered
+under the old name.
+"""
+import sys
+
+try:
+    import audioop  # type: ignore[attr-defined]  # Python <3.13
+except ModuleNotFoundError:
+    import audioop_lts as audioop  # type: ignore
+
+    sys.modules["audioop"] = audioop
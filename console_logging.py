@@ -0,0 +1,18 @@
+# console_logging.py
+import logging
+
+
+def enable_console_logging(level: int = logging.INFO, name: str = "tts_azure") -> None:
+    """
+    Prints the named logger's messages to stderr, leaving the root logger (and the
+    chatty HTTP/UI libraries that log through it) untouched. Safe to call repeatedly.
+    Meant for the command-line entry points; library modules only create loggers.
+    """
+    logger = logging.getLogger(name)
+    if not any(getattr(handler, "_s2s_console", False) for handler in logger.handlers):
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        handler._s2s_console = True  # type: ignore[attr-defined]
+        logger.addHandler(handler)
+    logger.setLevel(level)
+    logger.propagate = False
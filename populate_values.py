@@ -5,7 +5,10 @@ Fetches the latest Azure Translator languages and Azure Neural TTS voices,
 then writes normalized JSON datasets used by the UI without touching runtime code.
 
 Usage:
-    python populate_values.py
+    python populate_values.py [region] [--force]
+
+Existing datasets fetched for the same region within 24 hours are kept unless
+--force is given.
 """
 
 from __future__ import annotations
@@ -13,11 +16,20 @@ from __future__ import annotations
 import json
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # optional: faster (de)serialization of the catalogs
+except ImportError:  # pragma: no cover - fallback to the stdlib
+    orjson = None
 
 
 LANGUAGES_URL = "https://api.cognitive.microsofttranslator.com/languages"
@@ -27,13 +39,35 @@ VOICES_URL_TEMPLATE = (
 
 LANGUAGES_FILE = Path(__file__).resolve().parent / "azure_languages.json"
 VOICES_FILE = Path(__file__).resolve().parent / "azure_voices.json"
+# Records where and when the datasets were fetched; local only, so a fresh clone refetches.
+FETCH_META_FILE = Path(__file__).resolve().parent / "azure_fetch_meta.json"
+MAX_CACHE_AGE_SECONDS = 24 * 60 * 60
+
+
+def _create_session() -> requests.Session:
+    retry = Retry(total=2, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504])
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry),
+    )
+    return session
+
+
+SESSION = _create_session()
+
+
+def _parse_json(response: requests.Response):
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
 
 
 def fetch_languages() -> Dict[str, Dict[str, str]]:
     params = {"api-version": "3.0"}
-    response = requests.get(LANGUAGES_URL, params=params, timeout=15)
+    response = SESSION.get(LANGUAGES_URL, params=params, timeout=15)
     response.raise_for_status()
-    data = response.json()
+    data = _parse_json(response)
     translation = data.get("translation", {})
     return {
         code: {
@@ -45,7 +79,6 @@ def fetch_languages() -> Dict[str, Dict[str, str]]:
 
 
 def fetch_voices(region: str) -> Dict[str, List[Dict[str, str]]]:
-    load_dotenv()
     speech_key = os.getenv("AZURE_SPEECH_KEY")
 
     if not speech_key:
@@ -54,9 +87,9 @@ def fetch_voices(region: str) -> Dict[str, List[Dict[str, str]]]:
     url = VOICES_URL_TEMPLATE.format(region=region)
     headers = {"Ocp-Apim-Subscription-Key": speech_key}
 
-    response = requests.get(url, headers=headers, timeout=15)
+    response = SESSION.get(url, headers=headers, timeout=15)
     response.raise_for_status()
-    voices = response.json()
+    voices = _parse_json(response)
 
     grouped: Dict[str, List[Dict[str, str]]] = {}
     for voice in voices:
@@ -82,15 +115,48 @@ def fetch_voices(region: str) -> Dict[str, List[Dict[str, str]]]:
 
 
 def write_json(path: Path, payload) -> None:
+    if orjson is not None:
+        # Same layout as json.dumps(indent=2, ensure_ascii=False)
+        path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        return
     path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
 
 
-def main(region: str = "eastus") -> None:
-    print(f"[populate] Fetching translator languages...")
-    languages = fetch_languages()
+def _fetch_source(region: str) -> Dict[str, str]:
+    return {
+        "region": region,
+        "languages_url": LANGUAGES_URL,
+        "voices_url": VOICES_URL_TEMPLATE.format(region=region),
+    }
 
-    print(f"[populate] Fetching TTS voices for region '{region}'...")
-    voices = fetch_voices(region)
+
+def is_fresh(region: str, max_age: float = MAX_CACHE_AGE_SECONDS) -> bool:
+    """True if both datasets were fetched from the same endpoints within ``max_age``."""
+    if not (LANGUAGES_FILE.exists() and VOICES_FILE.exists()):
+        return False
+    try:
+        meta = json.loads(FETCH_META_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+    if meta.get("source") != _fetch_source(region):
+        return False
+    return time.time() - meta.get("fetched_at", 0) < max_age
+
+
+def main(region: str = "eastus", force: bool = False) -> None:
+    if not force and is_fresh(region):
+        print(
+            f"[populate] Datasets for region '{region}' are less than 24h old; "
+            "skipping (use --force to refresh)."
+        )
+        return
+
+    print(f"[populate] Fetching translator languages and TTS voices for region '{region}'...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        languages_future = executor.submit(fetch_languages)
+        voices_future = executor.submit(fetch_voices, region)
+        languages = languages_future.result()
+        voices = voices_future.result()
 
     print(f"[populate] Writing {LANGUAGES_FILE.name} ({len(languages)} entries)")
     write_json(LANGUAGES_FILE, languages)
@@ -98,11 +164,13 @@ def main(region: str = "eastus") -> None:
     print(f"[populate] Writing {VOICES_FILE.name} ({len(voices)} locales)")
     write_json(VOICES_FILE, voices)
 
+    write_json(FETCH_META_FILE, {"source": _fetch_source(region), "fetched_at": time.time()})
+
     print("[populate] Completed successfully.")
 
 
 if __name__ == "__main__":
-    region_arg = sys.argv[1] if len(sys.argv) > 1 else os.getenv(
-        "AZURE_SPEECH_REGION", "eastus"
-    )
-    main(region_arg)
+    load_dotenv()
+    args = [arg for arg in sys.argv[1:] if arg != "--force"]
+    region_arg = args[0] if args else os.getenv("AZURE_SPEECH_REGION", "eastus")
+    main(region_arg, force="--force" in sys.argv[1:])
@@ -1,9 +1,86 @@
 # s2s_translate.py
+import queue
+import threading
+
+from dotenv import load_dotenv
+
+from console_logging import enable_console_logging
 from silero_vadhelper import SileroVADHelper
 from stt_azure import AzureSTT
-from translate_azure import AzureTranslator
+from translate_azure import MAX_BATCH_CHARS, AzureTranslator
 from tts_azure import AzureTTS
 
+# Bounded hand-off queues give backpressure when a stage falls behind.
+QUEUE_SIZE = 4
+# Transcripts waiting for translation are sent together up to these limits.
+BATCH_MAX_ITEMS = 10
+# How often the listening loop and blocked hand-offs recheck whether a stage has failed.
+PUT_TIMEOUT_SECONDS = 0.5
+_STOP = None
+
+
+def stt_worker(azure_stt, chunks, texts):
+    """Transcribes VAD segments and hands the text to the translation stage."""
+    while (chunk := chunks.get()) is not _STOP:
+        text = azure_stt.transcribe_chunk(chunk)
+        if text:
+            print(f"🗒️ Transcribed: {text}")
+            texts.put(text)
+    texts.put(_STOP)
+
+
+def translate_worker(translator, texts, translations):
+    """Translates transcripts, batching whatever has queued up behind the first one."""
+    stopping = False
+    while not stopping and (text := texts.get()) is not _STOP:
+        batch = [text]
+        batch_chars = len(text)
+        while len(batch) < BATCH_MAX_ITEMS and batch_chars < MAX_BATCH_CHARS:
+            try:
+                queued = texts.get_nowait()
+            except queue.Empty:
+                break
+            if queued is _STOP:
+                stopping = True
+                break
+            batch.append(queued)
+            batch_chars += len(queued)
+
+        for translated in translator.translate_batch(batch):
+            if translated:
+                print(f"💬 Final Output: {translated}")
+                translations.put(translated)
+    translations.put(_STOP)
+
+
+def tts_worker(tts, translations):
+    """Speaks translations in the order they were produced."""
+    while (translated := translations.get()) is not _STOP:
+        tts.speak(translated)
+        print("🎧 Playback done.\n")
+
+
+def run_worker(failures, failed, target, *args):
+    """Runs a stage; an error is recorded and flagged instead of silently killing the thread."""
+    try:
+        target(*args)
+    except Exception as exc:
+        print(f"❌ {target.__name__} failed: {exc}")
+        failures.append(exc)
+        failed.set()
+
+
+def put_chunk(chunks, chunk, failed):
+    """Queues a VAD segment; returns False if a stage failed while waiting for room."""
+    while not failed.is_set():
+        try:
+            chunks.put(chunk, timeout=PUT_TIMEOUT_SECONDS)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
 def main():
     """
     Full Speech → Text → Translate → Speech pipeline.
@@ -11,28 +88,61 @@ def main():
     sends speech to Azure STT for transcription,
     translates it using Azure Translator,
     and finally speaks it using Azure TTS.
+    Each stage runs on its own thread so the next segment is transcribed
+    while the previous one is translated and spoken.
     """
+    load_dotenv()
+    enable_console_logging()
+
     # Initialize components
     vad = SileroVADHelper()
     azure_stt = AzureSTT()
     translator = AzureTranslator(target_lang="fr")  # Target translation: French
     tts = AzureTTS(language="fr-FR", voice_name="fr-FR-DeniseNeural")  # French voice
+    # Connect before listening so the first segment does not pay the handshakes
+    azure_stt.prewarm(sample_rate=vad.sample_rate)
+    translator.prewarm()
+
+    chunks = queue.Queue(maxsize=QUEUE_SIZE)
+    texts = queue.Queue(maxsize=QUEUE_SIZE)
+    translations = queue.Queue(maxsize=QUEUE_SIZE)
+    failures = []
+    failed = threading.Event()
+    stages = [
+        (stt_worker, (azure_stt, chunks, texts)),
+        (translate_worker, (translator, texts, translations)),
+        (tts_worker, (tts, translations)),
+    ]
+    workers = [
+        threading.Thread(target=run_worker, args=(failures, failed, target, *args), daemon=True)
+        for target, args in stages
+    ]
+    for worker in workers:
+        worker.start()
 
     print("\n🚀 Starting Speech → Text → Translate → Speech pipeline...\n")
     print("🎙️ Speak now! (3s silence threshold)\n")
 
     # Stream from microphone and process
-    for chunk in vad.start():
-        text = azure_stt.transcribe_chunk(chunk)
-
-        if text:
-            print(f"🗒️ Transcribed: {text}")
+    try:
+        # Idle ticks let the loop notice a failed stage even while nobody is speaking
+        for chunk in vad.start(idle_timeout=PUT_TIMEOUT_SECONDS):
+            if failed.is_set():
+                break
+            if chunk is None:
+                continue
+            if not put_chunk(chunks, chunk, failed):
+                break
+    finally:
+        # Unblock every stage; workers are daemons, so a full queue is fine to skip.
+        for stage_queue in (chunks, texts, translations):
+            try:
+                stage_queue.put_nowait(_STOP)
+            except queue.Full:
+                pass
 
-            translated = translator.translate_text(text)
-            if translated:
-                print(f"💬 Final Output: {translated}")
-                tts.speak(translated)
-                print("🎧 Playback done.\n")
+    if failures:
+        raise failures[0]
 
 if __name__ == "__main__":
     try:
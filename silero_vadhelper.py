@@ -3,40 +3,73 @@ silero_vadhelper.py
 -------------------
 Detects speech vs silence in real time using Silero VAD.
 Buffers audio and yields complete speech segments when 3s of silence are detected.
+Audio stays int16 PCM end to end; only the 512-sample model input is float32.
 """
 
+import importlib.util
 import torch
 import sounddevice as sd
 import numpy as np
 import time
-from queue import Queue
+from queue import Empty, Queue
 
 
 class SileroVADHelper:
-    def __init__(self, sample_rate=16000, threshold=0.6, silence_duration=3.0, min_chunk_sec=0.5):
+    def __init__(self, sample_rate=16000, threshold=0.6, silence_duration=3.0, min_chunk_sec=0.5,
+                 use_onnx=None, silence_peak=0.005, max_segment_sec=60.0):
         """
         Args:
             sample_rate: Audio sampling rate (Hz)
             threshold: Probability threshold for speech activity
             silence_duration: Seconds of silence before yielding a segment
             min_chunk_sec: Minimum valid speech duration to send to Azure
+            use_onnx: Run the ONNX export through onnxruntime (default: when installed)
+            silence_peak: Frames quieter than this peak skip the model while idle
+            max_segment_sec: Longest segment buffered before it is yielded regardless of silence
         """
         self.sample_rate = sample_rate
         self.threshold = threshold
         self.silence_duration = silence_duration
         self.min_chunk_sec = min_chunk_sec
+        self.silence_peak = silence_peak
+        self._silence_peak_pcm = int(silence_peak * 32768)
+        self._max_segment_len = int(sample_rate * max_segment_sec)
+        if use_onnx is None:
+            use_onnx = importlib.util.find_spec("onnxruntime") is not None
+        self.use_onnx = use_onnx
 
-        print("🔹 Loading Silero VAD model...")
+        print(f"🔹 Loading Silero VAD model ({'ONNX' if use_onnx else 'TorchScript'})...")
         self.model, utils = torch.hub.load(
             repo_or_dir="snakers4/silero-vad",
             model="silero_vad",
+            onnx=use_onnx,
             trust_repo=True
         )
         (_, _, _, self.VADIterator, _) = utils
 
+        # float32 model input, refreshed in place from each int16 frame
+        self._model_window = np.empty(512, dtype=np.float32)
+        self._model_input = torch.from_numpy(self._model_window)
+        self._gated = False
+
         self.audio_queue = Queue()
         self.speech_active = False
-        self.speech_buffer = []
+        # preallocated segment storage (30 s), doubled up to the segment cap
+        self.speech_buf = np.empty(min(int(sample_rate * 30), self._max_segment_len), dtype=np.int16)
+        self.speech_len = 0
+        self.last_speech_time = 0
+
+    def reset(self):
+        """Drops buffered audio and model state so the helper can listen again."""
+        while True:
+            try:
+                self.audio_queue.get_nowait()
+            except Empty:
+                break
+        self.model.reset_states()
+        self._gated = False
+        self.speech_active = False
+        self.speech_len = 0
         self.last_speech_time = 0
 
     def _audio_callback(self, indata, frames, time_info, status):
@@ -44,51 +77,106 @@ class SileroVADHelper:
             print("⚠️", status)
         self.audio_queue.put(indata.copy())
 
-    def start(self):
-        """Yields full speech segments when 3s of silence detected."""
+    def _append_speech(self, window):
+        end = self.speech_len + len(window)
+        if end > len(self.speech_buf):
+            grown = np.empty(max(end, 2 * len(self.speech_buf)), dtype=np.int16)
+            grown[:self.speech_len] = self.speech_buf[:self.speech_len]
+            self.speech_buf = grown
+        self.speech_buf[self.speech_len:end] = window
+        self.speech_len = end
+
+    def _process_window(self, window):
+        """Runs the VAD on one 512-sample frame; returns a finished segment or None."""
+        # near-silent frames cannot start speech, so skip the model while idle
+        peak = self._silence_peak_pcm
+        if not self.speech_active and window.max() < peak and window.min() > -peak:
+            if not self._gated:
+                self._gated = True
+                # the skipped frames break the model's running context
+                self.model.reset_states()
+            return None
+        self._gated = False
+
+        np.multiply(window, 1.0 / 32768.0, out=self._model_window)
+
+        try:
+            speech_prob = self.model(self._model_input, self.sample_rate).item()
+        except Exception as e:
+            print(f"⚠️ Silero VAD error: {e}")
+            return None
+
+        # speech detected
+        if speech_prob > self.threshold:
+            if not self.speech_active:
+                print("🗣️ Speech started")
+                self.speech_len = 0
+            self.speech_active = True
+            self._append_speech(window)
+            self.last_speech_time = time.time()
+
+            # bound memory on never-ending speech: ship what we have and keep going
+            if self.speech_len >= self._max_segment_len:
+                print(f"✂️ Segment reached {self._max_segment_len / self.sample_rate:.0f}s — yielding early...")
+                segment = torch.from_numpy(self.speech_buf[:self.speech_len].copy())
+                self.speech_len = 0
+                return segment
+
+        # silence after speech
+        elif self.speech_active and (time.time() - self.last_speech_time > self.silence_duration):
+            print(f"🤫 Silence detected for {self.silence_duration:.1f}s — finalizing segment...")
+            speech_len = self.speech_len
+            self.speech_active = False
+            self.speech_len = 0
+
+            # skip too-short noise
+            if speech_len < self.sample_rate * self.min_chunk_sec:
+                print("⚠️ Skipping very short/empty chunk")
+            else:
+                # copy out so the buffer can be reused for the next utterance
+                return torch.from_numpy(self.speech_buf[:speech_len].copy())
+
+        return None
+
+    def start(self, idle_timeout=None):
+        """
+        Yields full speech segments when 3s of silence detected.
+        With ``idle_timeout`` set, also yields None whenever that many seconds
+        pass without a segment, so callers can check for shutdown in between.
+        """
         frame_size = 512
-        rolling_buffer = np.zeros(0, dtype=np.float32)
+        # fixed staging window filled in place from the callback frames
+        window = np.empty(frame_size, dtype=np.int16)
+        filled = 0
+        queue_timeout = 0.5 if idle_timeout is None else idle_timeout
+        self.reset()
+        last_yield = time.monotonic()
 
         with sd.InputStream(channels=1, samplerate=self.sample_rate,
-                            callback=self._audio_callback, dtype="float32"):
+                            callback=self._audio_callback, dtype="int16"):
             print("🎙️ Listening (Silero VAD active, 3 s silence threshold)...\n")
 
             while True:
-                if not self.audio_queue.empty():
-                    frame = self.audio_queue.get().flatten()
-                    rolling_buffer = np.concatenate((rolling_buffer, frame))
-
-                    while len(rolling_buffer) >= frame_size:
-                        chunk = rolling_buffer[:frame_size]
-                        rolling_buffer = rolling_buffer[frame_size:]
-                        audio_tensor = torch.from_numpy(chunk)
-
-                        try:
-                            speech_prob = self.model(audio_tensor, self.sample_rate).item()
-                        except Exception as e:
-                            print(f"⚠️ Silero VAD error: {e}")
-                            continue
-
-                        # speech detected
-                        if speech_prob > self.threshold:
-                            if not self.speech_active:
-                                print("🗣️ Speech started")
-                                self.speech_buffer = []
-                            self.speech_active = True
-                            self.speech_buffer.append(audio_tensor)
-                            self.last_speech_time = time.time()
-
-                        # silence after speech
-                        elif self.speech_active and (time.time() - self.last_speech_time > self.silence_duration):
-                            print(f"🤫 Silence detected for {self.silence_duration:.1f}s — finalizing segment...")
-                            full_chunk = torch.cat(self.speech_buffer)
-                            self.speech_active = False
-                            self.speech_buffer = []
-
-                            # skip too-short noise
-                            if full_chunk.numel() < self.sample_rate * self.min_chunk_sec:
-                                print("⚠️ Skipping very short/empty chunk")
-                            else:
-                                yield full_chunk
-
-                time.sleep(0.01)
+                try:
+                    frame = self.audio_queue.get(timeout=queue_timeout).reshape(-1)
+                except Empty:
+                    frame = None
+                if idle_timeout is not None and time.monotonic() - last_yield >= idle_timeout:
+                    last_yield = time.monotonic()
+                    yield None
+                if frame is None:
+                    continue
+                offset = 0
+
+                while offset < len(frame):
+                    take = min(frame_size - filled, len(frame) - offset)
+                    window[filled:filled + take] = frame[offset:offset + take]
+                    filled += take
+                    offset += take
+
+                    if filled == frame_size:
+                        filled = 0
+                        segment = self._process_window(window)
+                        if segment is not None:
+                            last_yield = time.monotonic()
+                            yield segment
@@ -1,17 +1,45 @@
 # stt_azure.py
 import azure.cognitiveservices.speech as speechsdk
+import numpy as np
 import os
+import queue
+import threading
 from dotenv import load_dotenv
 
+# Silence Azure waits for before finalizing a phrase, and the padding we push
+# after each VAD segment so the phrase is closed without waiting for new audio.
+SEGMENT_SILENCE_MS = 500
+TRAILING_SILENCE_MS = SEGMENT_SILENCE_MS + 200
+# Push stream writes are sliced into ~10 KB blocks.
+WRITE_CHUNK_BYTES = 10240
+# A segment counts as fully recognized once results reach this close to its end.
+# Result offsets/durations are in 100 ns ticks from the start of the session.
+END_TOLERANCE_MS = SEGMENT_SILENCE_MS
+TICKS_PER_SECOND = 10_000_000
+# A segment whose tail is breath or noise never gets a result that reaches its
+# end. Once all of it has been pushed, a further phrase is expected within
+# Azure's segmentation silence plus network slack; stop waiting after that.
+END_OF_SEGMENT_SECONDS = (SEGMENT_SILENCE_MS + 300) / 1000
+
+_CANCELED = object()
+
+
 class AzureSTT:
-    def __init__(self):
+    def __init__(self, language="en-US", result_timeout=10.0, settle_seconds=0.1):
         """
-        Initializes Azure Speech SDK recognizer using environment variables.
+        Initializes a long-lived Azure Speech SDK recognizer using environment variables.
         Requires:
             AZURE_SPEECH_KEY
             AZURE_SPEECH_REGION
+
+        Args:
+            language: Recognition locale (default: 'en-US')
+            result_timeout: Seconds to wait for Azure to finalize a segment
+            settle_seconds: Extra wait for follow-up phrases once a segment is fully recognized
         """
-        load_dotenv()
+        # Entry points load .env once; only parse it here when used as a library.
+        if not (os.getenv("AZURE_SPEECH_KEY") and os.getenv("AZURE_SPEECH_REGION")):
+            load_dotenv()
         self.speech_key = os.getenv("AZURE_SPEECH_KEY")
         self.speech_region = os.getenv("AZURE_SPEECH_REGION")
 
@@ -22,48 +50,193 @@ class AzureSTT:
             subscription=self.speech_key,
             region=self.speech_region
         )
-        self.speech_config.speech_recognition_language = "en-US"
+        self.speech_config.speech_recognition_language = language
+        self.speech_config.set_property(
+            speechsdk.PropertyId.Speech_SegmentationSilenceTimeoutMs,
+            str(SEGMENT_SILENCE_MS),
+        )
+
+        self.result_timeout = result_timeout
+        self.settle_seconds = settle_seconds
+
+        self._lock = threading.Lock()
+        self._results = queue.Queue()
+        self._push_stream = None
+        self._recognizer = None
+        self._stream_rate = None
+        # Audio pushed into the current session so far, in result ticks
+        self._pushed_ticks = 0
+        # Reused conversion buffers, grown to the longest segment seen so far.
+        self._scaled = np.empty(0, dtype=np.float32)
+        self._pcm = np.empty(0, dtype=np.int16)
+
+    def set_language(self, language):
+        """
+        Switches the recognition locale; the recognizer restarts on the next segment.
+        """
+        if not language or language == self.speech_config.speech_recognition_language:
+            return
+        with self._lock:
+            self.speech_config.speech_recognition_language = language
+            self._stop_recognizer()
+
+    def prewarm(self, sample_rate=16000):
+        """
+        Starts the recognition session ahead of the first segment, so that
+        segment does not pay the connection setup.
+        """
+        with self._lock:
+            canceled = self._drain_results()
+            if canceled or self._recognizer is None or self._stream_rate != sample_rate:
+                self._stop_recognizer()
+                self._start_recognizer(sample_rate)
+
+    def close(self):
+        """Stops continuous recognition and releases the push stream."""
+        with self._lock:
+            self._stop_recognizer()
+
+    def _on_recognized(self, evt):
+        result = evt.result
+        if result.reason == speechsdk.ResultReason.RecognizedSpeech and result.text:
+            print(f"✅ Recognized: {result.text}")
+            self._results.put((result.text, result.offset + result.duration))
+        elif result.reason == speechsdk.ResultReason.NoMatch:
+            print("❌ No speech could be recognized.")
+            self._results.put(("", result.offset + result.duration))
+
+    def _on_canceled(self, evt):
+        cancellation = evt.cancellation_details
+        print(f"⚠️ Canceled: {cancellation.reason}")
+        if cancellation.reason == speechsdk.CancellationReason.Error:
+            print(f"Error details: {cancellation.error_details}")
+        self._results.put(_CANCELED)
+
+    def _start_recognizer(self, sample_rate):
+        stream_format = speechsdk.audio.AudioStreamFormat(
+            samples_per_second=sample_rate,
+            bits_per_sample=16,
+            channels=1,
+        )
+        self._push_stream = speechsdk.audio.PushAudioInputStream(stream_format=stream_format)
+        audio_config = speechsdk.audio.AudioConfig(stream=self._push_stream)
+        self._recognizer = speechsdk.SpeechRecognizer(
+            speech_config=self.speech_config,
+            audio_config=audio_config
+        )
+        self._recognizer.recognized.connect(self._on_recognized)
+        self._recognizer.canceled.connect(self._on_canceled)
+        self._recognizer.start_continuous_recognition_async().get()
+        self._stream_rate = sample_rate
+        self._pushed_ticks = 0
+        print(f"🔹 Azure STT streaming session started ({self.speech_config.speech_recognition_language})")
+
+    def _stop_recognizer(self):
+        recognizer, push_stream = self._recognizer, self._push_stream
+        self._recognizer = None
+        self._push_stream = None
+        self._stream_rate = None
+        if push_stream is not None:
+            push_stream.close()
+        if recognizer is not None:
+            try:
+                recognizer.stop_continuous_recognition_async().get()
+            except Exception as exc:  # pragma: no cover - defensive logging
+                print(f"⚠️ Azure STT stop error: {exc}")
+
+    def _drain_results(self):
+        """Discards stale results; True if the session was canceled meanwhile."""
+        canceled = False
+        while True:
+            try:
+                canceled = self._results.get_nowait() is _CANCELED or canceled
+            except queue.Empty:
+                return canceled
+
+    def _collect_results(self, segment_start, segment_end):
+        """
+        Gathers the phrases Azure recognizes in ``segment_start..segment_end``
+        (ticks). A segment may hold several phrases, so keep waiting until the
+        results reach its end, or until no phrase has followed for
+        END_OF_SEGMENT_SECONDS, rather than stopping after the first one.
+        """
+        try:
+            item = self._results.get(timeout=self.result_timeout)
+        except queue.Empty:
+            print("⚠️ Azure STT timed out waiting for a result.")
+            # A silent session is most likely dead; rebuild it next time.
+            self._stop_recognizer()
+            return None
+
+        phrases = []
+        covered = False
+        tolerance = END_TOLERANCE_MS * TICKS_PER_SECOND // 1000
+        while item is not _CANCELED:
+            text, end = item
+            if end > segment_start:  # older results belong to a previous segment
+                if text:
+                    phrases.append(text)
+                covered = end >= segment_end - tolerance
+            try:
+                item = self._results.get(
+                    timeout=self.settle_seconds if covered else END_OF_SEGMENT_SECONDS
+                )
+            except queue.Empty:
+                return " ".join(phrases) or None
+
+        # The session is unusable after a cancellation; rebuild it next time.
+        self._stop_recognizer()
+        return " ".join(phrases) or None
+
+    def _to_pcm_bytes(self, audio_data):
+        audio_data = audio_data.reshape(-1)
+        if audio_data.dtype == np.int16:
+            return audio_data.tobytes()
+
+        size = audio_data.shape[0]
+        if self._pcm.shape[0] < size:
+            self._scaled = np.empty(size, dtype=np.float32)
+            self._pcm = np.empty(size, dtype=np.int16)
+        scaled = self._scaled[:size]
+        pcm = self._pcm[:size]
+
+        # Clip first so out-of-range samples saturate instead of wrapping
+        np.clip(audio_data, -1.0, 1.0, out=scaled)
+        np.multiply(scaled, 32767.0, out=pcm, casting="unsafe")
+        return pcm.tobytes()
 
     def transcribe_chunk(self, audio_chunk, sample_rate=16000):
         """
-        Transcribes a given audio tensor or numpy array (float32, mono) using Azure Speech-to-Text.
+        Transcribes a given audio tensor or numpy array (int16 PCM or float32, mono)
+        using Azure Speech-to-Text.
         Returns:
             str: Transcribed text or None if failed.
         """
         # ensure numpy
-        import numpy as np
         if isinstance(audio_chunk, type(None)) or len(audio_chunk) == 0:
             return None
         if hasattr(audio_chunk, "numpy"):
             audio_data = audio_chunk.numpy()
         else:
-            audio_data = np.array(audio_chunk, dtype=np.float32)
+            audio_data = np.asarray(audio_chunk)
 
-        # Convert to bytes
-        audio_bytes = (audio_data * 32767).astype(np.int16).tobytes()
+        with self._lock:
+            # Convert to bytes, padded with silence so Azure closes the phrase
+            audio_bytes = self._to_pcm_bytes(audio_data)
+            audio_bytes += bytes(2 * int(sample_rate * TRAILING_SILENCE_MS / 1000))
 
-        # Configure push stream
-        stream = speechsdk.audio.PushAudioInputStream()
-        stream.write(audio_bytes)
-        stream.close()
+            # A cancellation that arrived between segments leaves the session unusable
+            canceled = self._drain_results()
+            if canceled or self._recognizer is None or self._stream_rate != sample_rate:
+                self._stop_recognizer()
+                self._start_recognizer(sample_rate)
 
-        audio_config = speechsdk.audio.AudioConfig(stream=stream)
-        recognizer = speechsdk.SpeechRecognizer(
-            speech_config=self.speech_config,
-            audio_config=audio_config
-        )
+            segment_start = self._pushed_ticks
+            segment_end = segment_start + len(audio_data.reshape(-1)) * TICKS_PER_SECOND // sample_rate
+            self._pushed_ticks += len(audio_bytes) // 2 * TICKS_PER_SECOND // sample_rate
 
-        print("🌀 Sending segment to Azure STT...")
-        result = recognizer.recognize_once_async().get()
+            print("🌀 Sending segment to Azure STT...")
+            for offset in range(0, len(audio_bytes), WRITE_CHUNK_BYTES):
+                self._push_stream.write(audio_bytes[offset:offset + WRITE_CHUNK_BYTES])
 
-        if result.reason == speechsdk.ResultReason.RecognizedSpeech:
-            print(f"✅ Recognized: {result.text}")
-            return result.text
-        elif result.reason == speechsdk.ResultReason.NoMatch:
-            print("❌ No speech could be recognized.")
-        elif result.reason == speechsdk.ResultReason.Canceled:
-            cancellation = result.cancellation_details
-            print(f"⚠️ Canceled: {cancellation.reason}")
-            if cancellation.reason == speechsdk.CancellationReason.Error:
-                print(f"Error details: {cancellation.error_details}")
-        return None
+            return self._collect_results(segment_start, segment_end)
@@ -0,0 +1,54 @@
+import queue
+import threading
+import time
+import unittest
+
+try:
+    import stt_azure
+except ImportError:  # pragma: no cover - Azure SDK / numpy not installed
+    stt_azure = None
+
+TICKS = 10_000_000
+
+
+@unittest.skipIf(stt_azure is None, "stt_azure dependencies are not installed")
+class CollectResultsTest(unittest.TestCase):
+    def make_stt(self):
+        # Bypass __init__: _collect_results only needs the result queue and timeouts.
+        stt = stt_azure.AzureSTT.__new__(stt_azure.AzureSTT)
+        stt._results = queue.Queue()
+        stt.result_timeout = 10.0
+        stt.settle_seconds = 0.1
+        return stt
+
+    def test_noise_tail_does_not_wait_for_result_timeout(self):
+        stt = self.make_stt()
+        # The only phrase ends 1 s before the segment does, e.g. a trailing breath.
+        stt._results.put(("hello", 4 * TICKS))
+
+        started = time.monotonic()
+        text = stt._collect_results(0, 5 * TICKS)
+        elapsed = time.monotonic() - started
+
+        self.assertEqual(text, "hello")
+        self.assertLess(elapsed, stt_azure.END_OF_SEGMENT_SECONDS + 0.5)
+
+    def test_waits_for_later_phrases_of_the_segment(self):
+        stt = self.make_stt()
+        stt._results.put(("first", 2 * TICKS))
+        timer = threading.Timer(0.3, stt._results.put, args=(("second", 5 * TICKS),))
+        timer.start()
+        self.addCleanup(timer.cancel)
+
+        self.assertEqual(stt._collect_results(0, 5 * TICKS), "first second")
+
+    def test_ignores_results_of_an_earlier_segment(self):
+        stt = self.make_stt()
+        stt._results.put(("stale", 3 * TICKS))
+        stt._results.put(("fresh", 9 * TICKS))
+
+        self.assertEqual(stt._collect_results(5 * TICKS, 9 * TICKS), "fresh")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,21 +1,38 @@
 import os
-from typing import Optional
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Azure Translator v3 limits per /translate call.
+MAX_BATCH_ITEMS = 100
+MAX_BATCH_CHARS = 5000
 
 
 class AzureTranslator:
-    def __init__(self, target_lang: str = "fr") -> None:
+    def __init__(
+        self,
+        target_lang: str = "fr",
+        cache_size: int = 512,
+        source_lang: Optional[str] = None,
+    ) -> None:
         """
         Initializes the Azure Translator client using environment variables.
+        Recent translations are kept in an LRU cache of ``cache_size`` entries.
+        Without ``source_lang`` Azure detects the input language per request.
 
         Expected .env values:
             AZURE_TRANSLATE_KEY
             AZURE_TRANSLATE_ENDPOINT
             AZURE_TRANSLATE_REGION (optional)
         """
-        load_dotenv()
+        # Entry points load .env once; only parse it here when used as a library.
+        if not (os.getenv("AZURE_TRANSLATE_ENDPOINT") and os.getenv("AZURE_TRANSLATE_KEY")):
+            load_dotenv()
         self.endpoint = os.getenv("AZURE_TRANSLATE_ENDPOINT")
         self.key = os.getenv("AZURE_TRANSLATE_KEY")
         self.region = os.getenv("AZURE_TRANSLATE_REGION")  # optional
@@ -25,10 +42,50 @@ class AzureTranslator:
 
         self.path = "/translate?api-version=3.0"
         self.target_lang = target_lang
+        self.source_lang = source_lang
         self._update_url()
 
+        self._headers = {
+            "Ocp-Apim-Subscription-Key": self.key,
+            "Content-Type": "application/json",
+        }
+        if self.region:
+            self._headers["Ocp-Apim-Subscription-Region"] = self.region
+        self._session = self._create_session()
+
+        self._cache: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_lock = threading.Lock()
+
+    def prewarm(self) -> None:
+        """
+        Opens the pooled TLS connection to the endpoint ahead of the first translation.
+        """
+        try:
+            self._session.head(self.endpoint, timeout=5)
+        except Exception as exc:  # pragma: no cover - network dependent
+            print(f"[AzureTranslator] Prewarm error: {exc}")
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        # Keep-alive pool so consecutive translations reuse the same TLS connection.
+        retry = Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"POST"}),
+        )
+        session = requests.Session()
+        session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=2, pool_maxsize=10, max_retries=retry),
+        )
+        return session
+
     def _update_url(self) -> None:
         self.url = f"{self.endpoint}{self.path}&to={self.target_lang}"
+        if self.source_lang:
+            self.url += f"&from={self.source_lang}"
 
     def set_target_language(self, target_lang: str) -> None:
         """
@@ -39,29 +96,84 @@ class AzureTranslator:
         self.target_lang = target_lang
         self._update_url()
 
+    def set_source_language(self, source_lang: Optional[str]) -> None:
+        """
+        Pins the input language (None to let Azure detect it) without recreating the client.
+        """
+        if source_lang == self.source_lang:
+            return
+        self.source_lang = source_lang
+        self._update_url()
+
+    def _cache_key(self, text: str) -> Tuple[str, str, str]:
+        return (self.source_lang or "", self.target_lang, " ".join(text.split()).casefold())
+
+    def _cache_get(self, key: Tuple[str, str, str]) -> Optional[str]:
+        with self._cache_lock:
+            translated = self._cache.get(key)
+            if translated is not None:
+                self._cache.move_to_end(key)
+            return translated
+
+    def _cache_put(self, key: Tuple[str, str, str], translated: str) -> None:
+        if self._cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._cache[key] = translated
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
     def translate_text(self, text: str) -> Optional[str]:
         """
         Translates the provided text. Returns the translated string or None on failure.
         """
-        if not text or not text.strip():
-            return None
+        return self.translate_batch([text])[0]
 
-        headers = {
-            "Ocp-Apim-Subscription-Key": self.key,
-            "Content-Type": "application/json",
-        }
-        if self.region:
-            headers["Ocp-Apim-Subscription-Region"] = self.region
+    def translate_batch(self, texts: List[str]) -> List[Optional[str]]:
+        """
+        Translates several texts with as few requests as the Azure limits allow.
+        Returns one entry per input, None for empty inputs or failed requests.
+        """
+        results: List[Optional[str]] = [None] * len(texts)
+        pending: List[Tuple[int, str]] = []
+        for index, text in enumerate(texts):
+            if not text or not text.strip():
+                continue
+            cached = self._cache_get(self._cache_key(text))
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.append((index, text))
+
+        batch: List[Tuple[int, str]] = []
+        batch_chars = 0
+        for index, text in pending:
+            too_full = (
+                len(batch) >= MAX_BATCH_ITEMS
+                or batch_chars + len(text) > MAX_BATCH_CHARS
+            )
+            if batch and too_full:
+                self._post_batch(batch, results)
+                batch, batch_chars = [], 0
+            batch.append((index, text))
+            batch_chars += len(text)
 
-        body = [{"text": text}]
+        if batch:
+            self._post_batch(batch, results)
+        return results
+
+    def _post_batch(self, batch: List[Tuple[int, str]], results: List[Optional[str]]) -> None:
+        body = [{"text": text} for _, text in batch]
 
         try:
-            response = requests.post(self.url, headers=headers, json=body, timeout=10)
+            response = self._session.post(self.url, headers=self._headers, json=body, timeout=10)
             response.raise_for_status()
             result = response.json()
-            translated = result[0]["translations"][0]["text"]
-            print(f"[AzureTranslator] Translated ({self.target_lang}): {translated}")
-            return translated
+            for (index, text), item in zip(batch, result):
+                translated = item["translations"][0]["text"]
+                print(f"[AzureTranslator] Translated ({self.target_lang}): {translated}")
+                results[index] = translated
+                self._cache_put(self._cache_key(text), translated)
         except Exception as exc:  # pragma: no cover - network dependent
             print(f"[AzureTranslator] Error: {exc}")
-            return None
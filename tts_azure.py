@@ -1,49 +1,518 @@
 # tts_azure.py
+import hashlib
+import io
+import logging
 import os
+import queue
+import random
+import re
+import tempfile
+import threading
+import time
+import wave
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Deque, List, Optional, Set, Union
 
-import azure.cognitiveservices.speech as speechsdk
-from dotenv import load_dotenv
+import sounddevice as sd
+
+if TYPE_CHECKING:
+    import azure.cognitiveservices.speech as speechsdk
+else:
+    # The Speech SDK native binding is large; it is imported by the first AzureTTS.
+    speechsdk = None
+
+logger = logging.getLogger(__name__)
+
+# Azure sends raw PCM, which is streamed to the output device as-is and
+# wrapped in a WAV header for files. The format is a SpeechSynthesisOutputFormat
+# member name, resolved once the SDK is loaded.
+PLAYBACK_SAMPLE_RATE = 24000
+PLAYBACK_FORMAT = "Raw24Khz16BitMonoPcm"
+# Files are written in one large buffered block.
+FILE_WRITE_BUFFER_BYTES = 512 * 1024
+# Service properties applied to every synthesis config: keep audio uncompressed
+# on the wire (nothing to decode locally) and fail fast on a slow backend.
+SYNTH_SERVICE_PROPERTIES = {
+    "SpeechServiceConnection_SynthEnableCompressedAudioTransmission": "false",
+    "SpeechServiceConnection_SynthBackendConnectionTimeoutMs": "3000",
+}
+
+# Pooled synthesizers are recycled after ~10 minutes, jittered so a pool
+# does not reconnect all at once.
+SYNTH_MAX_AGE_RANGE = (540.0, 600.0)
+# Longest gap tolerated between two audio chunks of the same utterance.
+CHUNK_TIMEOUT_SECONDS = 15.0
+# How long a stopped or timed-out synthesis gets to report its result; a
+# synthesizer that misses this is closed rather than returned to the pool.
+SYNTH_SETTLE_SECONDS = 2.0
+# Playback starts once this much audio is queued; each device underflow
+# doubles it up to the maximum.
+PREBUFFER_INITIAL_MS = 20
+PREBUFFER_MAX_MS = 320
+_BYTES_PER_MS = PLAYBACK_SAMPLE_RATE * 2 // 1000
+
+# Synthesized utterances are cached on disk as WAV files, oldest dropped first.
+AUDIO_CACHE_DIR = Path.home() / ".cache" / "azure_tts"
+AUDIO_CACHE_MAX_BYTES = 64 * 1024 * 1024
+# The most recently used clips are also kept in memory, skipping the disk read.
+AUDIO_CACHE_MEMORY_BYTES = 8 * 1024 * 1024
+
+# Long inputs are synthesized sentence by sentence so playback starts early.
+_SENTENCE_END = re.compile(r"(?<=[.!?。！？])\s+")
+
+_DONE = object()
+
+
+def _load_speechsdk() -> None:
+    global speechsdk
+    if speechsdk is None:
+        import azure.cognitiveservices.speech as sdk
+
+        speechsdk = sdk
+
+
+class AudioCache:
+    """
+    Byte-budgeted LRU of WAV files under ``directory``, keyed by a hex digest.
+    Order is tracked in memory and seeded from file mtimes so it survives restarts.
+    The hottest ``memory_bytes`` worth of clips are also held in memory.
+    """
+
+    def __init__(
+        self,
+        directory: Path = AUDIO_CACHE_DIR,
+        max_bytes: int = AUDIO_CACHE_MAX_BYTES,
+        memory_bytes: int = AUDIO_CACHE_MEMORY_BYTES,
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.memory_bytes = memory_bytes
+        self._lock = threading.Lock()
+        self._sizes: "OrderedDict[str, int]" = OrderedDict()
+        self._total = 0
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_total = 0
+
+        entries = []
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            files = list(self.directory.glob("*.wav"))
+        except OSError as exc:
+            logger.warning("[AzureTTS] Audio cache unavailable: %s", exc)
+            files = []
+        for path in files:
+            try:
+                stat = path.stat()
+            except OSError:  # removed meanwhile, e.g. by another process
+                continue
+            entries.append((stat.st_mtime, path.stem, stat.st_size))
+        for _, key, size in sorted(entries):
+            self._sizes[key] = size
+            self._total += size
+        with self._lock:
+            self._evict()
+
+    @staticmethod
+    def make_key(text: str, language: str, voice_name: str) -> str:
+        material = "\0".join((text.strip(), language, voice_name)).encode("utf-8")
+        return hashlib.blake2b(material, digest_size=16).hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.directory / f"{key}.wav"
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._sizes
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            if key not in self._sizes:
+                return None
+            self._sizes.move_to_end(key)
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                return data
+        path = self.path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            self._forget(key)
+            return None
+        with self._lock:
+            if key in self._sizes:
+                self._remember(key, data)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        if not data or len(data) > self.max_bytes:
+            return
+        path = self.path(key)
+        # Write under a unique temporary name so readers never see a partial
+        # file and concurrent puts of the same key do not clobber each other
+        tmp_name = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                dir=self.directory, prefix=f"{key}.", suffix=".tmp", delete=False
+            ) as tmp_file:
+                tmp_name = tmp_file.name
+                tmp_file.write(data)
+            os.replace(tmp_name, path)
+        except OSError as exc:
+            logger.warning("[AzureTTS] Audio cache write error: %s", exc)
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+            return
+        with self._lock:
+            self._total += len(data) - self._sizes.pop(key, 0)
+            self._sizes[key] = len(data)
+            self._remember(key, data)
+            self._evict()
+
+    def _remember(self, key: str, data: bytes) -> None:
+        # Caller holds _lock; memory entries are always a subset of the files on disk
+        if len(data) > self.memory_bytes:
+            return
+        self._memory_total += len(data) - len(self._memory.pop(key, b""))
+        self._memory[key] = data
+        while self._memory_total > self.memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_total -= len(evicted)
+
+    def _forget(self, key: str) -> None:
+        with self._lock:
+            self._total -= self._sizes.pop(key, 0)
+            self._memory_total -= len(self._memory.pop(key, b""))
+
+    def _evict(self) -> None:
+        while self._total > self.max_bytes and self._sizes:
+            key, size = self._sizes.popitem(last=False)
+            self._total -= size
+            self._memory_total -= len(self._memory.pop(key, b""))
+            try:
+                self.path(key).unlink()
+            except OSError:
+                pass
+
+
+def _pcm_to_wav(pcm: bytes) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(PLAYBACK_SAMPLE_RATE)
+        wav_file.writeframes(pcm)
+    return buffer.getvalue()
+
+
+def _wav_to_pcm(data: bytes) -> bytes:
+    with wave.open(io.BytesIO(data), "rb") as wav_file:
+        return wav_file.readframes(wav_file.getnframes())
+
+
+class _PooledSynthesizer:
+    """
+    A synthesizer without an audio device whose connection is opened up front.
+    Audio chunks are forwarded to whichever queue is attached as ``sink``.
+    """
+
+    def __init__(self, speech_config: "speechsdk.SpeechConfig") -> None:
+        self.synthesizer = speechsdk.SpeechSynthesizer(
+            speech_config=speech_config,
+            audio_config=None,
+        )
+        # Opening the connection performs the WebSocket/TLS handshake now
+        # instead of on the first utterance; keep a reference so it stays open.
+        self.connection = speechsdk.Connection.from_speech_synthesizer(self.synthesizer)
+        self.connection.open(False)
+        self.expires_at = time.monotonic() + random.uniform(*SYNTH_MAX_AGE_RANGE)
+        self.sink: Optional[queue.Queue] = None
+        # Set once the current synthesis has completed or been canceled.
+        self.finished = threading.Event()
+
+        self.synthesizer.synthesizing.connect(self._on_synthesizing)
+        self.synthesizer.synthesis_completed.connect(self._on_finished)
+        self.synthesizer.synthesis_canceled.connect(self._on_finished)
+
+    def _on_synthesizing(self, evt) -> None:
+        sink = self.sink
+        if sink is not None:
+            sink.put(evt.result.audio_data)
+
+    def _on_finished(self, evt) -> None:
+        sink = self.sink
+        if sink is not None:
+            sink.put(_DONE)
+        self.finished.set()
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def close(self) -> None:
+        try:
+            self.connection.close()
+        except Exception as exc:  # pragma: no cover - defensive logging
+            logger.warning("[AzureTTS] Connection close error: %s", exc)
+
+
+class _SynthesizerPool:
+    """
+    Idle pre-connected synthesizers sharing one SpeechConfig (and so one output format).
+    """
+
+    def __init__(
+        self,
+        speech_config: "speechsdk.SpeechConfig",
+        size: int,
+        executor: ThreadPoolExecutor,
+    ) -> None:
+        self.speech_config = speech_config
+        self.size = size
+        self._executor = executor
+        self._lock = threading.Lock()
+        self._idle: Deque[_PooledSynthesizer] = deque()
+        self._closed = False
+
+    def prewarm(self, wait: bool = True) -> None:
+        with self._lock:
+            stale = [entry for entry in self._idle if entry.expired()]
+            self._idle = deque(entry for entry in self._idle if not entry.expired())
+            missing = self.size - len(self._idle)
+        for entry in stale:
+            entry.close()
+
+        futures = [
+            self._executor.submit(_PooledSynthesizer, self.speech_config)
+            for _ in range(missing)
+        ]
+        for future in futures:
+            if wait:
+                self._add(future.result())
+            else:
+                future.add_done_callback(self._add_when_ready)
+
+    def _add_when_ready(self, future: Future) -> None:
+        if future.exception() is None:
+            self._add(future.result())
+        else:  # pragma: no cover - network dependent
+            logger.warning("[AzureTTS] Prewarm error: %s", future.exception())
+
+    def _add(self, entry: _PooledSynthesizer) -> None:
+        with self._lock:
+            if not self._closed and not entry.expired() and len(self._idle) < max(self.size, 1):
+                self._idle.append(entry)
+                return
+        entry.close()
+
+    def acquire(self) -> _PooledSynthesizer:
+        with self._lock:
+            while self._idle:
+                entry = self._idle.popleft()
+                if not entry.expired():
+                    return entry
+                entry.close()
+        return _PooledSynthesizer(self.speech_config)
+
+    def release(self, entry: _PooledSynthesizer) -> None:
+        # Entries past their age, or returned after the pool was replaced, are dropped.
+        self._add(entry)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, deque()
+        for entry in idle:
+            entry.close()
+
+
+class _Utterance:
+    """
+    One text being synthesized on a pooled synthesizer; audio collects in ``chunks``
+    until it is played.
+    """
+
+    def __init__(self, pool: _SynthesizerPool, text: str, cache_key: str) -> None:
+        self.pool = pool
+        self.cache_key = cache_key
+        self.entry = pool.acquire()
+        self.chunks: queue.Queue = queue.Queue()
+        self.entry.sink = self.chunks
+        self.entry.finished.clear()
+        self.result_future = self.entry.synthesizer.speak_text_async(text)
+
+    def stop(self) -> None:
+        try:
+            self.entry.synthesizer.stop_speaking_async()
+        except Exception as exc:  # pragma: no cover - defensive logging
+            logger.warning("[AzureTTS] Cancel error: %s", exc)
+
+    def settle(self, timeout: float = SYNTH_SETTLE_SECONDS):
+        """
+        Waits up to ``timeout`` for the synthesis result, then gives the
+        synthesizer back to the pool. A synthesizer that never finishes is
+        closed instead, so no late event reaches its next user.
+        Returns the result, or None if it did not arrive in time.
+        """
+        self.entry.sink = None
+        if not self.entry.finished.wait(timeout):
+            logger.warning("[AzureTTS] Synthesis did not finish; dropping its connection.")
+            self.entry.close()
+            return None
+        result = self.result_future.get()
+        self.pool.release(self.entry)
+        return result
+
+    def drain(self) -> None:
+        while True:
+            try:
+                self.chunks.get_nowait()
+            except queue.Empty:
+                return
 
 
 class AzureTTS:
-    def __init__(self, language: str = "fr-FR", voice_name: str = "fr-FR-DeniseNeural"):
+    def __init__(
+        self,
+        language: str = "fr-FR",
+        voice_name: str = "fr-FR-DeniseNeural",
+        num_prewarm: int = 3,
+        audio_cache: Optional[AudioCache] = None,
+    ):
         """
         Azure Text-to-Speech helper class.
 
         Args:
             language: Speech synthesis language code (default: 'fr-FR')
             voice_name: Azure voice name (default: 'fr-FR-DeniseNeural')
+            num_prewarm: Synthesizer connections kept open between utterances
+            audio_cache: Cache of synthesized utterances (default: ~/.cache/azure_tts)
 
         Requires in .env:
             AZURE_SPEECH_KEY
             AZURE_SPEECH_REGION
         """
-        load_dotenv()
+        # Entry points load .env once; only parse it here when used as a library.
+        if not (os.getenv("AZURE_SPEECH_KEY") and os.getenv("AZURE_SPEECH_REGION")):
+            from dotenv import load_dotenv
+
+            load_dotenv()
         self.speech_key = os.getenv("AZURE_SPEECH_KEY")
         self.speech_region = os.getenv("AZURE_SPEECH_REGION")
 
         if not self.speech_key or not self.speech_region:
             raise ValueError("Missing AZURE_SPEECH_KEY or AZURE_SPEECH_REGION in .env")
 
+        _load_speechsdk()
+
         # Configure Azure Speech
-        self.speech_config = speechsdk.SpeechConfig(
+        self.speech_config = self._build_speech_config(language, voice_name)
+
+        self.num_prewarm = num_prewarm
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(num_prewarm, 1), thread_name_prefix="AzureTTS"
+        )
+        self._pool = _SynthesizerPool(self.speech_config, num_prewarm, self._executor)
+        # A single playback worker keeps utterances in call order.
+        self._playback_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="AzureTTSPlayback")
+        self._output: Optional[sd.RawOutputStream] = None
+        self._prebuffer_bytes = PREBUFFER_INITIAL_MS * _BYTES_PER_MS
+        self.audio_cache = audio_cache if audio_cache is not None else AudioCache()
+        self._active: Optional[_PooledSynthesizer] = None
+        # Bumped by stop(); jobs queued under an older generation are skipped.
+        self._generation = 0
+        self._generation_lock = threading.Lock()
+        # Utterances whose synthesis is running, queued or playing; guarded by
+        # _generation_lock so stop() reaches those not picked up by the worker yet.
+        self._utterances: Set[_Utterance] = set()
+        self.prewarm()
+
+        logger.info("[AzureTTS] Initialized (%s, %s)", language, voice_name)
+
+    def _build_speech_config(
+        self,
+        language: str,
+        voice_name: str,
+    ) -> "speechsdk.SpeechConfig":
+        speech_config = speechsdk.SpeechConfig(
             subscription=self.speech_key,
             region=self.speech_region,
         )
 
         # Set language and voice
-        self.speech_config.speech_synthesis_language = language
-        self.speech_config.speech_synthesis_voice_name = voice_name
+        speech_config.speech_synthesis_language = language
+        speech_config.speech_synthesis_voice_name = voice_name
+        speech_config.set_speech_synthesis_output_format(
+            getattr(speechsdk.SpeechSynthesisOutputFormat, PLAYBACK_FORMAT)
+        )
+        for name, value in SYNTH_SERVICE_PROPERTIES.items():
+            speech_config.set_property_by_name(name, value)
+        return speech_config
 
-        # Default output to system speakers
-        self.audio_config = speechsdk.audio.AudioOutputConfig(use_default_speaker=True)
+    def prewarm(self) -> None:
+        """
+        Opens synthesizer connections up to ``num_prewarm`` so the next speak()
+        does not pay the WebSocket/TLS handshake. Safe to call repeatedly.
+        """
+        self._pool.prewarm(wait=True)
 
-        self.synthesizer = speechsdk.SpeechSynthesizer(
-            speech_config=self.speech_config,
-            audio_config=self.audio_config,
+    def close(self) -> None:
+        """
+        Stops playback and closes every pooled connection.
+        """
+        self.stop()
+        self._pool.close()
+        self._executor.shutdown(wait=False)
+        self._playback_executor.submit(self._close_output)
+        self._playback_executor.shutdown(wait=False)
+        logger.info("[AzureTTS] Closed.")
+
+    def _cache_key(self, text: str) -> str:
+        return self.audio_cache.make_key(
+            text,
+            self.speech_config.speech_synthesis_language,
+            self.speech_config.speech_synthesis_voice_name,
         )
 
-        print(f"[AzureTTS] Initialized ({language}, {voice_name})")
+    def _output_stream(self) -> sd.RawOutputStream:
+        # Runs on the playback thread only; the device stays open between utterances.
+        if self._output is None:
+            self._output = sd.RawOutputStream(
+                samplerate=PLAYBACK_SAMPLE_RATE, channels=1, dtype="int16"
+            )
+        if not self._output.active:
+            self._output.start()
+        return self._output
+
+    def _close_output(self) -> None:
+        output, self._output = self._output, None
+        if output is not None:
+            output.close()
+
+    def _write_audio(self, output: sd.RawOutputStream, pcm: Union[bytes, memoryview]) -> None:
+        underflowed = output.write(pcm)
+        if underflowed and self._prebuffer_bytes < PREBUFFER_MAX_MS * _BYTES_PER_MS:
+            self._prebuffer_bytes *= 2
+
+    def _is_stopped(self, generation: int) -> bool:
+        return self._generation != generation
+
+    def _play_cached(self, wav_bytes: bytes, generation: int) -> None:
+        output = self._output_stream()
+        pcm = memoryview(_wav_to_pcm(wav_bytes))
+        # Written in prebuffer-sized slices so stop() can cut the clip short
+        step = self._prebuffer_bytes
+        for offset in range(0, len(pcm), step):
+            if self._is_stopped(generation):
+                output.abort()
+                return
+            self._write_audio(output, pcm[offset:offset + step])
+        logger.debug("[AzureTTS] Playback completed (cached).")
 
     def configure_voice(self, language: str, voice_name: str) -> None:
         """
@@ -59,41 +528,160 @@ class AzureTTS:
         if have_same_voice:
             return
 
-        self.speech_config.speech_synthesis_language = language
-        self.speech_config.speech_synthesis_voice_name = voice_name
-        self.synthesizer = speechsdk.SpeechSynthesizer(
-            speech_config=self.speech_config,
-            audio_config=self.audio_config,
-        )
-        print(f"[AzureTTS] Reconfigured ({language}, {voice_name})")
+        self.speech_config = self._build_speech_config(language, voice_name)
+        old_pool = self._pool
+        self._pool = _SynthesizerPool(self.speech_config, self.num_prewarm, self._executor)
+        old_pool.close()
+        self.prewarm()
+        logger.info("[AzureTTS] Reconfigured (%s, %s)", language, voice_name)
 
     def speak(self, text: str) -> None:
         """
-        Speaks the provided text aloud.
+        Speaks the provided text aloud, starting playback with the first audio chunk.
+        Blocks until playback finishes; see speak_async() for the non-blocking form.
+        """
+        self.speak_async(text).result()
+
+    def speak_async(self, text: str) -> Future:
+        """
+        Starts synthesizing ``text`` right away and queues it for playback.
+        Utterances play one at a time in call order, so the next one is
+        synthesized while the current one is still playing. Multi-sentence
+        text is split and its sentences synthesized in parallel, at most one
+        per pooled connection.
+        Returns a Future that resolves once this utterance has been played.
         """
         if not text or not text.strip():
-            return
+            done: Future = Future()
+            done.set_result(None)
+            return done
+
+        logger.debug("[AzureTTS] Speaking: %s", text)
+        sentences = [sentence for sentence in _SENTENCE_END.split(text.strip()) if sentence]
+        # Captured now, so a stop() issued while this job waits in the queue still applies
+        generation = self._generation
+        first = self._prepare(sentences[0], generation)
+        return self._playback_executor.submit(
+            self._play_sentences, generation, first, sentences[1:]
+        )
 
-        print(f"[AzureTTS] Speaking: {text}")
-        result = self.synthesizer.speak_text_async(text).get()
+    def _prepare(self, sentence: str, generation: int) -> Union[bytes, "_Utterance"]:
+        """Returns cached WAV bytes, or an utterance whose synthesis has started."""
+        cache_key = self._cache_key(sentence)
+        cached = self.audio_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        utterance = _Utterance(self._pool, sentence, cache_key)
+        with self._generation_lock:
+            self._utterances.add(utterance)
+            stale = self._is_stopped(generation)
+        if stale:  # stop() ran while this one was being started
+            utterance.stop()
+        return utterance
 
+    def _settle(self, utterance: "_Utterance", stop: bool):
+        # Unregister first, so stop() never touches a synthesizer back in the pool
+        with self._generation_lock:
+            self._utterances.discard(utterance)
+        if stop:
+            utterance.stop()
+        return utterance.settle()
+
+    def _play_sentences(
+        self, generation: int, first: Union[bytes, "_Utterance"], rest: List[str]
+    ) -> None:
+        ahead: Deque[Union[bytes, _Utterance]] = deque([first])
+        remaining = deque(rest)
+        limit = max(self._pool.size, 1)
+
+        try:
+            while ahead and not self._is_stopped(generation):
+                while remaining and len(ahead) < limit:
+                    ahead.append(self._prepare(remaining.popleft(), generation))
+                item = ahead.popleft()
+                if isinstance(item, bytes):
+                    self._play_cached(item, generation)
+                else:
+                    self._play_utterance(item, generation)
+        finally:
+            for item in ahead:
+                if isinstance(item, _Utterance):
+                    self._settle(item, stop=True)
+
+    def _play_utterance(self, utterance: "_Utterance", generation: int) -> None:
+        entry = utterance.entry
+        played: List[bytes] = []
+        self._active = entry
+        completed = False
+
+        try:
+            output = self._output_stream()
+            pending: Optional[List[bytes]] = []
+            pending_bytes = 0
+            timed_out = False
+            while not self._is_stopped(generation):
+                try:
+                    chunk = utterance.chunks.get(timeout=CHUNK_TIMEOUT_SECONDS)
+                except queue.Empty:
+                    logger.warning("[AzureTTS] Timed out waiting for audio.")
+                    timed_out = True
+                    break
+                if chunk is _DONE:
+                    completed = not self._is_stopped(generation)
+                    break
+                played.append(chunk)
+                if pending is not None:
+                    # Hold back the first few chunks so playback starts without stuttering
+                    pending.append(chunk)
+                    pending_bytes += len(chunk)
+                    if pending_bytes < self._prebuffer_bytes:
+                        continue
+                    chunk, pending = b"".join(pending), None
+                self._write_audio(output, chunk)
+            stopped = self._is_stopped(generation)
+            if stopped:
+                output.abort()
+                utterance.drain()
+            elif pending:
+                self._write_audio(output, b"".join(pending))
+        finally:
+            self._active = None
+            result = self._settle(utterance, stop=not completed)
+
+        if result is None:
+            return
         if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
-            print("[AzureTTS] Playback completed.")
+            # Only cache audio that was played to the end
+            if not (timed_out or stopped):
+                self.audio_cache.put(utterance.cache_key, _pcm_to_wav(b"".join(played)))
+            logger.debug("[AzureTTS] Playback completed.")
         elif result.reason == speechsdk.ResultReason.Canceled:
             cancellation = result.cancellation_details
-            print(f"[AzureTTS] Playback canceled: {cancellation.reason}")
+            logger.warning("[AzureTTS] Playback canceled: %s", cancellation.reason)
             if cancellation.reason == speechsdk.CancellationReason.Error:
-                print(f"[AzureTTS] Error details: {cancellation.error_details}")
+                logger.error("[AzureTTS] Error details: %s", cancellation.error_details)
 
     def stop(self) -> None:
         """
-        Cancels any ongoing speech playback immediately.
+        Cancels any ongoing speech playback immediately, along with everything
+        queued by speak_async() so far. Returns without waiting for Azure to
+        acknowledge; the playback worker winds the utterances down.
         """
+        with self._generation_lock:
+            self._generation += 1
+            # Includes syntheses queued by speak_async that the worker has not reached
+            for utterance in self._utterances:
+                utterance.stop()
+        active = self._active
         try:
-            self.synthesizer.stop_speaking_async().get()
-            print("[AzureTTS] Playback stopped.")
+            if active is not None:
+                # Wake the playback worker now rather than at the next chunk
+                sink = active.sink
+                if sink is not None:
+                    sink.put(_DONE)
+            logger.debug("[AzureTTS] Playback stopped.")
         except Exception as exc:  # pragma: no cover - defensive logging
-            print(f"[AzureTTS] Stop error: {exc}")
+            logger.warning("[AzureTTS] Stop error: %s", exc)
 
     def save_to_file(self, text: str, filename: str = "output.wav") -> None:
         """
@@ -102,20 +690,30 @@ class AzureTTS:
         if not text or not text.strip():
             return
 
-        print(f"[AzureTTS] Saving synthesized speech to {filename}")
-        file_config = speechsdk.audio.AudioOutputConfig(filename=filename)
-
-        file_synth = speechsdk.SpeechSynthesizer(
-            speech_config=self.speech_config,
-            audio_config=file_config,
-        )
+        logger.debug("[AzureTTS] Saving synthesized speech to %s", filename)
+        cache_key = self._cache_key(text)
+        cached = self.audio_cache.get(cache_key)
+        if cached is not None:
+            with open(filename, "wb", buffering=FILE_WRITE_BUFFER_BYTES) as wav_file:
+                wav_file.write(cached)
+            logger.info("[AzureTTS] Audio saved successfully (cached): %s", filename)
+            return
 
-        result = file_synth.speak_text_async(text).get()
+        pool = self._pool
+        entry = pool.acquire()
+        try:
+            result = entry.synthesizer.speak_text_async(text).get()
+        finally:
+            pool.release(entry)
 
         if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
-            print(f"[AzureTTS] Audio saved successfully: {filename}")
+            wav_bytes = _pcm_to_wav(result.audio_data)
+            with open(filename, "wb", buffering=FILE_WRITE_BUFFER_BYTES) as wav_file:
+                wav_file.write(wav_bytes)
+            self.audio_cache.put(cache_key, wav_bytes)
+            logger.info("[AzureTTS] Audio saved successfully: %s", filename)
         elif result.reason == speechsdk.ResultReason.Canceled:
             cancellation = result.cancellation_details
-            print(f"[AzureTTS] Save canceled: {cancellation.reason}")
+            logger.warning("[AzureTTS] Save canceled: %s", cancellation.reason)
             if cancellation.reason == speechsdk.CancellationReason.Error:
-                print(f"[AzureTTS] Error details: {cancellation.error_details}")
+                logger.error("[AzureTTS] Error details: %s", cancellation.error_details)
@@ -1,37 +1,42 @@
 import base64
+import functools
 import json
+import os
+import pickle
+import queue
+import sys
+import tempfile
 import threading
 from dataclasses import dataclass
 from pathlib import Path
 import time
-from typing import Dict, List, Optional, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
 
-try:
-    import audioop  # type: ignore[attr-defined]  # Python <3.13
-except ModuleNotFoundError:
-    import sys
-
-    import audioop_lts as audioop  # type: ignore
-
-    sys.modules["audioop"] = audioop
+import numpy as np
+from dotenv import load_dotenv
 
-import gradio as gr
+try:
+    import orjson  # optional: faster parsing of the catalog JSON
+except ImportError:  # pragma: no cover - fallback to the stdlib
+    orjson = None
 
+from console_logging import enable_console_logging
 from silero_vadhelper import SileroVADHelper
-from stt_azure import AzureSTT
+from stt_azure import SEGMENT_SILENCE_MS, AzureSTT
 from translate_azure import AzureTranslator
 from tts_azure import AzureTTS
 
 
-@dataclass(frozen=True)
-class VoiceOption:
+class VoiceOption(NamedTuple):
     short_name: str
     locale: str
     gender: str
     name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LanguageOption:
     code: str
     name: str
@@ -39,6 +44,22 @@ class LanguageOption:
     locales: List[str]
     voices: List[VoiceOption]
     default_locale: str
+    voice_short_names: FrozenSet[str]
+
+
+class _StateSnapshot(NamedTuple):
+    log_text: str
+    transcription: str
+    translation: str
+    status: str
+    version: int  # bumped on every write so pollers can skip unchanged state
+
+
+class _ResolvedSelection(NamedTuple):
+    key: Tuple[str, str, Optional[str]]
+    source: Optional[LanguageOption]
+    target: Optional[LanguageOption]
+    voice: Optional[VoiceOption]  # None when either language is unknown
 
 
 @dataclass
@@ -52,39 +73,67 @@ class _PipelineClients:
     voice_name: str
 
 
+_MODULE_DIR = Path(__file__).resolve().parent
+
 DEFAULT_SOURCE = "en"
 DEFAULT_TARGET = "fr"
 DEFAULT_SILENCE_SECONDS = 3.0
+# The listening loop wakes at least this often to notice stop requests.
+VAD_IDLE_TIMEOUT = 0.1
+# The UI stream waits this long after a change so bursts of updates go out
+# together, and wakes at least every STREAM_WAKE_SECONDS while idle.
+UI_BATCH_SECONDS = 0.05
+STREAM_WAKE_SECONDS = 5.0
+# Browser sessions streamed at once; each holds one worker thread for its lifetime.
+MAX_UI_STREAMS = 32
+# Segments/texts allowed to wait between two pipeline stages.
+STAGE_QUEUE_SIZE = 2
+# Segments that queued up behind a slow STT call are sent as one request,
+# up to this many segments / seconds of audio.
+STT_BATCH_MAX_SEGMENTS = 4
+STT_BATCH_MAX_SECONDS = 20.0
+
+LANGUAGES_FILE = "azure_languages.json"
+VOICES_FILE = "azure_voices.json"
+# Prebuilt catalog, reused while both JSON files keep their paths and
+# modification times. Kept in the user's cache directory rather than beside
+# the module. Bump the version whenever the option classes change shape.
+CATALOG_CACHE_FILE = Path.home() / ".cache" / "speech_two_speech" / "azure_meta.pkl"
+CATALOG_CACHE_VERSION = 3
 
 
 def _load_json(filename: str):
-    path = Path(__file__).resolve().parent / filename
+    path = _MODULE_DIR / filename
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     with path.open("r", encoding="utf-8") as handle:
         return json.load(handle)
 
 
-def _matches_language(locale: str, code: str) -> bool:
-    locale_lower = locale.lower()
-    code_lower = code.lower()
-    if locale_lower == code_lower:
-        return True
-    return locale_lower.split("-")[0] == code_lower.split("-")[0]
+def _language_prefix(tag: str) -> str:
+    return tag.split("-", 1)[0].lower()
 
 
 def _build_language_options() -> Tuple[
     Dict[str, LanguageOption], Dict[str, VoiceOption]
 ]:
-    languages_data = _load_json("azure_languages.json")
-    voices_data = _load_json("azure_voices.json")
+    languages_data = _load_json(LANGUAGES_FILE)
+    voices_data = _load_json(VOICES_FILE)
 
     language_options: Dict[str, LanguageOption] = {}
     voices_by_name: Dict[str, VoiceOption] = {}
 
+    # A locale serves a language when their primary subtags match.
+    locales_by_prefix: Dict[str, List[Tuple[str, list]]] = {}
+    for locale, voice_entries in voices_data.items():
+        locales_by_prefix.setdefault(_language_prefix(locale), []).append(
+            (sys.intern(locale), voice_entries)
+        )
+
     for code, details in languages_data.items():
         voice_options: List[VoiceOption] = []
-        for locale, voice_entries in voices_data.items():
-            if not _matches_language(locale, code):
-                continue
+        voice_locales = set()
+        for locale, voice_entries in locales_by_prefix.get(_language_prefix(code), ()):
             for entry in voice_entries:
                 short_name = entry.get("short_name")
                 if not short_name:
@@ -92,16 +141,18 @@ def _build_language_options() -> Tuple[
                 voice = VoiceOption(
                     short_name=short_name,
                     locale=locale,
-                    gender=entry.get("gender", "Unknown"),
+                    gender=sys.intern(entry.get("gender", "Unknown")),
                     name=entry.get("name", short_name),
                 )
                 voice_options.append(voice)
+                voice_locales.add(locale)
+                voices_by_name[short_name] = voice
 
         if not voice_options:
             continue
 
         voice_options.sort(key=lambda v: v.short_name.lower())
-        locales = sorted({voice.locale for voice in voice_options})
+        locales = sorted(voice_locales)
         default_locale = locales[0] if locales else ""
 
         option = LanguageOption(
@@ -111,9 +162,9 @@ def _build_language_options() -> Tuple[
             locales=locales,
             voices=voice_options,
             default_locale=default_locale,
+            voice_short_names=frozenset(voice.short_name for voice in voice_options),
         )
         language_options[code] = option
-        voices_by_name.update({voice.short_name: voice for voice in voice_options})
 
     if not language_options:
         raise RuntimeError(
@@ -123,7 +174,63 @@ def _build_language_options() -> Tuple[
     return language_options, voices_by_name
 
 
-LANGUAGE_OPTIONS, VOICES_BY_NAME = _build_language_options()
+def _cached_language_options() -> Tuple[
+    Dict[str, LanguageOption], Dict[str, VoiceOption]
+]:
+    languages_path = _MODULE_DIR / LANGUAGES_FILE
+    voices_path = _MODULE_DIR / VOICES_FILE
+    # The module name is part of the signature: pickled classes are looked up
+    # under it, and it differs between `python ui_app.py` and `import ui_app`.
+    signature = (
+        CATALOG_CACHE_VERSION,
+        __name__,
+        str(languages_path),
+        languages_path.stat().st_mtime_ns,
+        str(voices_path),
+        voices_path.stat().st_mtime_ns,
+    )
+
+    try:
+        with CATALOG_CACHE_FILE.open("rb") as handle:
+            cached = pickle.load(handle)
+        if cached["sig"] == signature:
+            return cached["data"]
+    except Exception:
+        pass  # missing, stale or unreadable; rebuild below
+
+    data = _build_language_options()
+    # Write to a unique temporary file and swap it in, so concurrent processes
+    # never read a partial cache; failing to write only costs the speed-up.
+    tmp_name = None
+    try:
+        CATALOG_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=CATALOG_CACHE_FILE.parent, suffix=".tmp", delete=False
+        ) as handle:
+            tmp_name = handle.name
+            pickle.dump({"sig": signature, "data": data}, handle, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, CATALOG_CACHE_FILE)
+    except Exception as exc:
+        print(f"Could not write {CATALOG_CACHE_FILE}: {exc}")
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+    return data
+
+
+# Catalog tables, filled in place by load_catalog() so importing the module
+# stays free of file I/O; everything below holds references to these objects.
+LANGUAGE_OPTIONS: Dict[str, LanguageOption] = {}
+VOICES_BY_NAME: Dict[str, VoiceOption] = {}
+# Language dropdown order and (label, value) choices, shared by every interface build.
+SORTED_LANGUAGE_OPTIONS: List[LanguageOption] = []
+LANGUAGE_ITEMS: List[Tuple[str, str]] = []
+# Voice dropdown choices per target language, shared by every UI event.
+VOICE_CHOICES_BY_LANG: Dict[str, List[str]] = {}
+# First listed voice of each language, preselected whenever it becomes the target.
+DEFAULT_VOICE_BY_LANG: Dict[str, Optional[str]] = {}
 
 
 class SpeechTranslationController:
@@ -132,19 +239,33 @@ class SpeechTranslationController:
     ):
         self._languages = languages
         self._voices = voices
-        self._thread: Optional[threading.Thread] = None
+        # One long-lived runner executes each start request's pipeline in turn.
+        self._runner: Optional[threading.Thread] = None
+        self._commands: queue.SimpleQueue = queue.SimpleQueue()
         self._thread_lock = threading.Lock()
+        # Serializes start/stop/restart requests from the UI so a restart is atomic.
+        # Separate from _thread_lock, which the pipeline thread itself takes on exit
+        # while a stop is waiting for it. Hard stop deliberately bypasses it.
+        self._lifecycle_lock = threading.RLock()
         self._stop_event = threading.Event()
+        # Cleared while a pipeline run is pending or active; set once it has fully shut down.
+        self._done_event = threading.Event()
+        self._done_event.set()
         self._vad_stream = None
 
-        self._status = "Stopped"
-        self._last_transcription = ""
-        self._last_translation = ""
-        self._log_lines: List[str] = []
         self._max_log_lines = 200
+        self._log_lines: Deque[str] = deque(maxlen=self._max_log_lines)
+        # Copy-on-write view of the UI state. Writers build a new snapshot under
+        # _state_lock; readers take the current one without locking, relying on
+        # CPython rebinding attributes atomically.
+        self._snapshot = _StateSnapshot("", "", "", "Stopped", 0)
         self._state_lock = threading.Lock()
+        self._state_changed = threading.Condition(self._state_lock)
         self._current_tts: Optional[AzureTTS] = None
         self._client_bundle: Optional[_PipelineClients] = None
+        self._resolved: Optional[_ResolvedSelection] = None
+        # Loading the Silero model dominates start-up, so the helper is kept across runs.
+        self._vad: Optional[SileroVADHelper] = None
         self._sleep_interval = 0.05
 
     def start(
@@ -154,62 +275,86 @@ class SpeechTranslationController:
         voice_name: str,
         silence_seconds: float,
     ) -> str:
-        with self._thread_lock:
-            if self._thread and self._thread.is_alive():
+        with self._lifecycle_lock, self._thread_lock:
+            if not self._done_event.is_set():
                 return "Already running"
 
-            source_option = self._languages.get(source_lang)
-            target_option = self._languages.get(target_lang)
-            if not source_option or not target_option:
-                self._append_log("Invalid language selection.")
-                self._set_status("Error")
+            resolved = self.resolve(source_lang, target_lang, voice_name)
+            if resolved.voice is None:
+                self._transition("Error", "Invalid language selection.")
                 return "Invalid language selection"
-
-            voice_option = self._voices.get(voice_name)
-            if not voice_option or voice_option.short_name not in {
-                v.short_name for v in target_option.voices
-            }:
-                voice_option = target_option.voices[0]
-                voice_name = voice_option.short_name
-
-            if not voice_option:
-                self._append_log("No Azure voice available for the selected language.")
-                self._set_status("Error")
-                return "Voice unavailable"
+            source_option, target_option, voice_option = (
+                resolved.source,
+                resolved.target,
+                resolved.voice,
+            )
 
             silence_seconds = max(0.5, float(silence_seconds))
 
             self._reset_state()
-            self._append_log(
+            self._transition(
+                "Initializing...",
                 "Initializing pipeline with "
                 f"STT locale {source_option.default_locale}, "
                 f"translator code {target_option.code}, "
                 f"TTS voice {voice_option.short_name}, "
-                f"silence duration {silence_seconds:.1f}s"
+                f"silence duration {silence_seconds:.1f}s",
             )
-            self._set_status("Initializing...")
 
             self._stop_event.clear()
-            self._thread = threading.Thread(
-                target=self._run_pipeline,
-                args=(
-                    source_option,
-                    target_option,
-                    voice_option,
-                    silence_seconds,
-                ),
-                daemon=True,
-            )
-            self._thread.start()
+            self._done_event.clear()
+            self._commands.put((source_option, target_option, voice_option, silence_seconds))
+            if self._runner is None:
+                self._runner = threading.Thread(target=self._run_commands, daemon=True)
+                self._runner.start()
             return "Initializing..."
 
+    def _run_commands(self) -> None:
+        while True:
+            command = self._commands.get()
+            try:
+                self._run_pipeline(*command)
+            except Exception as exc:  # pragma: no cover - _run_pipeline logs its own errors
+                self._transition("Error", f"Pipeline error: {exc}")
+                self._done_event.set()
+
+    def resolve(
+        self,
+        source_lang: str,
+        target_lang: str,
+        voice_name: Optional[str],
+    ) -> _ResolvedSelection:
+        """
+        Looks up the options behind a UI selection, falling back to the target's
+        first voice. The UI calls this on every dropdown change, so start()
+        normally finds the result already cached.
+        """
+        key = (source_lang, target_lang, voice_name)
+        resolved = self._resolved
+        if resolved is not None and resolved.key == key:
+            return resolved
+
+        source_option = self._languages.get(source_lang)
+        target_option = self._languages.get(target_lang)
+        voice_option = None
+        if source_option and target_option:
+            voice_option = self._voices.get(voice_name) if voice_name else None
+            if not voice_option or voice_name not in target_option.voice_short_names:
+                voice_option = target_option.voices[0]
+
+        resolved = _ResolvedSelection(key, source_option, target_option, voice_option)
+        self._resolved = resolved
+        return resolved
+
     def _prepare_clients(
         self,
         source_option: LanguageOption,
         target_option: LanguageOption,
         voice_option: VoiceOption,
+        executor: ThreadPoolExecutor,
     ) -> _PipelineClients:
         stt_locale = source_option.default_locale or source_option.locales[0]
+        source_code = source_option.code
         target_code = target_option.code
         voice_locale = voice_option.locale
         voice_name = voice_option.short_name
@@ -217,23 +362,30 @@ class SpeechTranslationController:
         bundle = self._client_bundle
 
         if bundle is None:
-            stt = AzureSTT()
-            translator = AzureTranslator(target_lang=target_code)
-            tts = AzureTTS(language=voice_locale, voice_name=voice_name)
+            stt_future = executor.submit(AzureSTT, language=stt_locale)
+            translator_future = executor.submit(
+                AzureTranslator, target_lang=target_code, source_lang=source_code
+            )
+            tts_future = executor.submit(AzureTTS, language=voice_locale, voice_name=voice_name)
+            stt = stt_future.result()
+            translator = translator_future.result()
+            tts = tts_future.result()
         else:
             stt = bundle.stt
             translator = bundle.translator
             tts = bundle.tts
 
             if stt.speech_config.speech_recognition_language != stt_locale:
-                stt.speech_config.speech_recognition_language = stt_locale
+                stt.set_language(stt_locale)
 
             current_target = getattr(translator, "target_lang", None)
             if current_target != target_code:
                 if hasattr(translator, "set_target_language"):
                     translator.set_target_language(target_code)
                 else:  # defensive fallback
-                    translator = AzureTranslator(target_lang=target_code)
+                    translator = AzureTranslator(target_lang=target_code, source_lang=source_code)
+            if getattr(translator, "source_lang", None) != source_code:
+                translator.set_source_language(source_code)
 
             current_voice_locale = getattr(tts.speech_config, "speech_synthesis_language", None)
             current_voice_name = getattr(tts.speech_config, "speech_synthesis_voice_name", None)
@@ -243,6 +395,9 @@ class SpeechTranslationController:
                 else:  # defensive fallback
                     tts = AzureTTS(language=voice_locale, voice_name=voice_name)
 
+            if hasattr(tts, "prewarm"):
+                tts.prewarm()
+
         bundle = _PipelineClients(
             stt=stt,
             translator=translator,
@@ -255,6 +410,31 @@ class SpeechTranslationController:
         self._client_bundle = bundle
         return bundle
 
+    def _warm_up(
+        self,
+        clients: _PipelineClients,
+        sample_rate: int,
+        executor: ThreadPoolExecutor,
+    ) -> None:
+        # Connect everything while still "Initializing..." so the first segment is not late.
+        # TTS connections were already opened by _prepare_clients.
+        warm_ups = [
+            ("STT", executor.submit(clients.stt.prewarm, sample_rate=sample_rate)),
+            ("Translator", executor.submit(clients.translator.prewarm)),
+        ]
+        for name, future in warm_ups:
+            try:
+                future.result()
+            except Exception as exc:
+                self._append_log(f"{name} warm-up failed: {exc}")
+
+    def _prepare_vad(self, silence_seconds: float) -> SileroVADHelper:
+        if self._vad is None:
+            self._vad = SileroVADHelper(silence_duration=silence_seconds)
+        else:
+            self._vad.silence_duration = silence_seconds
+        return self._vad
+
     def _should_stop(self) -> bool:
         return self._stop_event.is_set()
 
@@ -317,18 +497,18 @@ class SpeechTranslationController:
         return False
 
     def _close_vad_stream(self) -> None:
-        if self._vad_stream:
+        # Swap under the lock so the stop path and pipeline teardown never both close it
+        with self._thread_lock:
+            stream, self._vad_stream = self._vad_stream, None
+        if stream:
             try:
-                self._vad_stream.close()
+                stream.close()
             except Exception:
                 pass
-            finally:
-                self._vad_stream = None
 
     def _stop_pipeline(self, force: bool) -> str:
         with self._thread_lock:
-            thread = self._thread
-            if not thread or not thread.is_alive():
+            if self._done_event.is_set():
                 self._set_status("Stopped")
                 return "Already stopped"
 
@@ -336,13 +516,7 @@ class SpeechTranslationController:
             self._stop_event.set()
             current_tts = self._current_tts
 
-        if self._vad_stream:
-            try:
-                self._vad_stream.close()
-            except Exception:
-                pass
-            finally:
-                self._vad_stream = None
+        self._close_vad_stream()
 
         if force and current_tts:
             try:
@@ -354,33 +528,28 @@ class SpeechTranslationController:
             "Hard stop requested by user." if force else "Stop requested by user."
         )
 
-        if thread:
-            thread.join(timeout=2.0)
-            if thread.is_alive():
-                self._append_log("Background thread is taking longer to stop...")
-                thread.join()
-
-        with self._thread_lock:
-            self._thread = None
+        if not self._done_event.wait(timeout=2.0):
+            self._append_log("Background thread is taking longer to stop...")
+            self._done_event.wait()
 
         self._set_status("Stopped")
         return "Stopped"
 
     def stop(self) -> str:
-        return self._stop_pipeline(force=False)
+        with self._lifecycle_lock:
+            return self._stop_pipeline(force=False)
 
     def hard_stop(self) -> str:
         return self._stop_pipeline(force=True)
 
-    def snapshot(self):
-        with self._state_lock:
-            log_text = "\n".join(self._log_lines[-self._max_log_lines :])
-            return (
-                log_text,
-                self._last_transcription,
-                self._last_translation,
-                self._status,
-            )
+    def snapshot(self) -> _StateSnapshot:
+        return self._snapshot
+
+    def wait_for_change(self, version: int, timeout: Optional[float] = None) -> _StateSnapshot:
+        """Blocks until the state moves past ``version`` (or ``timeout``) and returns it."""
+        with self._state_changed:
+            self._state_changed.wait_for(lambda: self._snapshot.version != version, timeout)
+            return self._snapshot
 
     def _run_pipeline(
         self,
@@ -391,81 +560,67 @@ class SpeechTranslationController:
     ) -> None:
         clients: Optional[_PipelineClients] = None
         vad: Optional[SileroVADHelper] = None
+        workers: List[threading.Thread] = []
         try:
-            clients = self._prepare_clients(source_option, target_option, voice_option)
-            vad = SileroVADHelper(silence_duration=silence_seconds)
+            # The Silero model load and the Azure handshakes are independent; overlap them.
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                vad_future = executor.submit(self._prepare_vad, silence_seconds)
+                clients = self._prepare_clients(
+                    source_option, target_option, voice_option, executor
+                )
+                vad = vad_future.result()
+                self._warm_up(clients, vad.sample_rate, executor)
             stt_language = clients.stt_locale
 
             with self._thread_lock:
                 self._current_tts = clients.tts
 
-            self._append_log(
+            self._transition(
+                "Listening...",
                 "Components initialized "
                 f"(STT {stt_language}, translation {clients.target_code}, "
-                f"TTS {clients.voice_name})."
+                f"TTS {clients.voice_name}).",
             )
-            self._set_status("Listening...")
             self._sleep_briefly()
 
-            self._append_log("Silero VAD ready; awaiting speech segments.")
-            self._vad_stream = vad.start()
-
-            for speech_chunk in self._vad_stream:
-                if self._should_stop():
-                    self._append_log("Stop signal received; exiting listening loop.")
-                    break
-
-                self._set_status("Transcribing...")
-                text = self._transcribe_with_retry(
-                    clients.stt,
-                    speech_chunk,
-                    vad.sample_rate,
+            # STT, translation and TTS each run on their own thread, so the next
+            # segment is transcribed while the previous translation is spoken.
+            chunks: queue.Queue = queue.Queue(maxsize=STAGE_QUEUE_SIZE)
+            texts: queue.Queue = queue.Queue(maxsize=STAGE_QUEUE_SIZE)
+            translations: queue.Queue = queue.Queue(maxsize=STAGE_QUEUE_SIZE)
+            stages = [
+                (self._stt_stage, (clients.stt, vad.sample_rate, chunks, texts)),
+                (self._translate_stage, (clients.translator, texts, translations)),
+                (self._tts_stage, (clients.tts, translations)),
+            ]
+            for target, args in stages:
+                worker = threading.Thread(
+                    target=self._run_stage, args=(target, *args), daemon=True
                 )
-                if not text:
-                    self._append_log("No transcription returned after retries.")
-                    self._set_status("Listening...")
-                    self._sleep_briefly()
-                    continue
-
-                self._record_transcription(text)
-                self._append_log(f"Recognized text: {text}")
-
-                if self._should_stop():
-                    self._append_log("Stop signal detected before translation stage.")
-                    break
+                worker.start()
+                workers.append(worker)
 
-                self._set_status("Translating...")
-                translated = self._translate_with_retry(clients.translator, text)
-                if not translated:
-                    self._append_log("Translation failed or returned empty result.")
-                    self._set_status("Listening...")
-                    self._sleep_briefly()
-                    continue
-
-                self._record_translation(translated)
-                self._append_log(f"Translation: {translated}")
+            self._append_log("Silero VAD ready; awaiting speech segments.")
+            vad_stream = vad.start(idle_timeout=VAD_IDLE_TIMEOUT)
+            with self._thread_lock:
+                self._vad_stream = vad_stream
 
+            for speech_chunk in vad_stream:
                 if self._should_stop():
-                    self._append_log("Stop signal detected before TTS stage.")
+                    self._append_log("Stop signal received; exiting listening loop.")
                     break
-
-                self._set_status("Speaking...")
-                if not self._speak_with_retry(clients.tts, translated):
-                    self._append_log("TTS playback failed after retries.")
-                    self._set_status("Listening...")
-                    self._sleep_briefly()
+                if speech_chunk is None:
                     continue
-
-                self._append_log("TTS playback completed.")
-                self._set_status("Listening...")
-                if self._should_stop():
+                if not self._put_stage(chunks, speech_chunk):
                     break
-                self._sleep_briefly()
 
         except Exception as exc:
-            self._append_log(f"Pipeline error: {exc}")
-            self._set_status("Error")
+            self._transition("Error", f"Pipeline error: {exc}")
         finally:
+            # Release the stage workers; each finishes its current item first.
+            self._stop_event.set()
+            for worker in workers:
+                worker.join()
             self._stop_event.clear()
             self._close_vad_stream()
             if vad and hasattr(vad, "stop"):
@@ -482,42 +637,168 @@ class SpeechTranslationController:
 
             with self._thread_lock:
                 self._current_tts = None
-                if threading.current_thread() is self._thread:
-                    self._thread = None
 
-            self._set_status("Stopped")
-            self._append_log("Pipeline stopped.")
+            self._transition("Stopped", "Pipeline stopped.")
+            self._done_event.set()
+
+    def _put_stage(self, stage_queue: queue.Queue, item) -> bool:
+        """Hands ``item`` to the next stage; False if the pipeline stopped first."""
+        while not self._should_stop():
+            try:
+                stage_queue.put(item, timeout=VAD_IDLE_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get_stage(self, stage_queue: queue.Queue):
+        """Next item from a stage queue, or None once the pipeline stops."""
+        while not self._should_stop():
+            try:
+                return stage_queue.get(timeout=VAD_IDLE_TIMEOUT)
+            except queue.Empty:
+                continue
+        return None
+
+    def _run_stage(self, target, *args) -> None:
+        try:
+            target(*args)
+        except Exception as exc:
+            self._transition("Error", f"Pipeline error: {exc}")
+            self._stop_event.set()
+
+    @staticmethod
+    def _drain_chunks(chunks: queue.Queue, speech_chunk, sample_rate: int):
+        """
+        Joins the segments already waiting behind ``speech_chunk`` into one.
+        Returns the joined audio and the segment that did not fit, if any,
+        which the caller sends next.
+        """
+        segments = [np.asarray(speech_chunk).reshape(-1)]
+        total = segments[0].shape[0]
+        max_samples = int(STT_BATCH_MAX_SECONDS * sample_rate)
+        carry = None
+        while len(segments) < STT_BATCH_MAX_SEGMENTS:
+            try:
+                queued = chunks.get_nowait()
+            except queue.Empty:
+                break
+            queued = np.asarray(queued).reshape(-1)
+            if total + queued.shape[0] > max_samples:
+                carry = queued
+                break
+            segments.append(queued)
+            total += queued.shape[0]
+        if len(segments) == 1:
+            return speech_chunk, carry
+
+        # Keep a pause between segments so Azure still finalizes them as separate phrases
+        gap = np.zeros(int(sample_rate * SEGMENT_SILENCE_MS / 1000), dtype=segments[0].dtype)
+        joined = [segments[0]]
+        for segment in segments[1:]:
+            joined.append(gap)
+            joined.append(segment)
+        return np.concatenate(joined), carry
+
+    def _stt_stage(
+        self,
+        stt: AzureSTT,
+        sample_rate: int,
+        chunks: queue.Queue,
+        texts: queue.Queue,
+    ) -> None:
+        carry = None
+        while True:
+            if carry is not None and not self._should_stop():
+                speech_chunk, carry = carry, None
+            elif (speech_chunk := self._get_stage(chunks)) is None:
+                break
+            speech_chunk, carry = self._drain_chunks(chunks, speech_chunk, sample_rate)
+            self._set_status("Transcribing...")
+            text = self._transcribe_with_retry(stt, speech_chunk, sample_rate)
+            if not text:
+                self._transition("Listening...", "No transcription returned after retries.")
+                continue
+
+            self._record_transcription(text)
+            self._append_log(f"Recognized text: {text}")
+            if not self._put_stage(texts, text):
+                break
+
+    def _translate_stage(
+        self,
+        translator: AzureTranslator,
+        texts: queue.Queue,
+        translations: queue.Queue,
+    ) -> None:
+        while (text := self._get_stage(texts)) is not None:
+            self._set_status("Translating...")
+            translated = self._translate_with_retry(translator, text)
+            if not translated:
+                self._transition("Listening...", "Translation failed or returned empty result.")
+                continue
+
+            self._record_translation(translated)
+            self._append_log(f"Translation: {translated}")
+            if not self._put_stage(translations, translated):
+                break
+
+    def _tts_stage(self, tts: AzureTTS, translations: queue.Queue) -> None:
+        while (translated := self._get_stage(translations)) is not None:
+            self._set_status("Speaking...")
+            if not self._speak_with_retry(tts, translated):
+                self._transition("Listening...", "TTS playback failed after retries.")
+            else:
+                self._transition("Listening...", "TTS playback completed.")
+
+    def _publish(self, **changes) -> None:
+        # Caller holds _state_lock
+        snapshot = self._snapshot
+        self._snapshot = snapshot._replace(version=snapshot.version + 1, **changes)
+        self._state_changed.notify_all()
+
+    def _log_text_with(self, message: str) -> str:
+        # Caller holds _state_lock
+        entry = f"[{time.strftime('%H:%M:%S')}] {message}"
+        log_text = self._snapshot.log_text
+        if not log_text:
+            log_text = entry
+        elif len(self._log_lines) < self._max_log_lines:
+            log_text = f"{log_text}\n{entry}"
+        else:
+            # The deque is about to drop its oldest line; drop it (and its separator) too
+            log_text = f"{log_text[len(self._log_lines[0]) + 1:]}\n{entry}"
+        self._log_lines.append(entry)
+        return log_text
 
     def _append_log(self, message: str) -> None:
         with self._state_lock:
-            timestamp = time.strftime("%H:%M:%S")
-            entry = f"[{timestamp}] {message}"
-            self._log_lines.append(entry)
-            if len(self._log_lines) > self._max_log_lines:
-                self._log_lines = self._log_lines[-self._max_log_lines:]
+            self._publish(log_text=self._log_text_with(message))
+
+    def _transition(self, status: str, message: str) -> None:
+        """Logs ``message`` and switches to ``status`` as a single UI update."""
+        with self._state_lock:
+            self._publish(log_text=self._log_text_with(message), status=status)
 
     def _record_transcription(self, text: str) -> None:
         with self._state_lock:
-            self._last_transcription = text
+            self._publish(transcription=text)
 
     def _record_translation(self, text: str) -> None:
         with self._state_lock:
-            self._last_translation = text
+            self._publish(translation=text)
 
     def _set_status(self, status: str) -> None:
         with self._state_lock:
-            self._status = status
+            self._publish(status=status)
 
     def _reset_state(self) -> None:
         with self._state_lock:
             self._log_lines.clear()
-            self._last_transcription = ""
-            self._last_translation = ""
-            self._status = "Stopped"
+            self._publish(log_text="", transcription="", translation="", status="Stopped")
 
     def is_running(self) -> bool:
-        with self._thread_lock:
-            return self._thread is not None and self._thread.is_alive()
+        return not self._done_event.is_set()
 
     def restart_with(
         self,
@@ -526,8 +807,9 @@ class SpeechTranslationController:
         voice_name: str,
         silence_seconds: float,
     ) -> str:
-        self.stop()
-        return self.start(source_lang, target_lang, voice_name, silence_seconds)
+        with self._lifecycle_lock:
+            self.stop()
+            return self.start(source_lang, target_lang, voice_name, silence_seconds)
 
 
 controller = SpeechTranslationController(LANGUAGE_OPTIONS, VOICES_BY_NAME)
@@ -555,22 +837,48 @@ def hard_stop_pipeline():
     return controller.hard_stop()
 
 
-def refresh_outputs():
-    logs, transcription, translation, status = controller.snapshot()
-    return logs, transcription, translation, status
+def _gr_update(**kwargs):
+    # Gradio is imported lazily by build_interface; handlers only run after it has been.
+    import gradio as gr
 
+    return gr.update(**kwargs)
 
-def update_voices(selected_target: str):
-    option = LANGUAGE_OPTIONS.get(selected_target)
-    if not option or not option.voices:
-        return gr.update(choices=[], value=None, interactive=False)
 
-    default_voice = option.voices[0].short_name
-    choices = [voice.short_name for voice in option.voices]
-    return gr.update(choices=choices, value=default_voice, interactive=True)
+def stream_outputs():
+    """
+    Streams controller state to the UI as it changes instead of polling:
+    sleeps until the next write, lets the burst settle, then yields once.
+    Fields that did not change are sent as no-op updates.
+    """
+    version = -1
+    shown: Tuple[Optional[str], ...] = (None, None, None, None)
+    while True:
+        snapshot = controller.wait_for_change(version, timeout=STREAM_WAKE_SECONDS)
+        if snapshot.version == version:
+            # Gradio only notices a closed tab when it sends something, so
+            # heartbeat with no-ops; that is what ends a disconnected stream.
+            yield (_gr_update(),) * 4
+            continue
+        time.sleep(UI_BATCH_SECONDS)
+        snapshot = controller.snapshot()
+        version = snapshot.version
+        values = (
+            snapshot.log_text,
+            snapshot.transcription,
+            snapshot.translation,
+            snapshot.status,
+        )
+        # Unchanged fields are skipped, but a changed log goes out whole: a Textbox
+        # update replaces its value and Gradio has no append for it. The log is
+        # capped at _max_log_lines, which bounds that payload.
+        yield tuple(
+            _gr_update() if value == previous else value
+            for value, previous in zip(values, shown)
+        )
+        shown = values
 
 
-def describe_language(code: str) -> str:
+def _describe_language(code: str) -> str:
     option = LANGUAGE_OPTIONS.get(code)
     if not option:
         return f"**{code}** — unavailable in metadata."
@@ -590,7 +898,7 @@ def describe_language(code: str) -> str:
     )
 
 
-def describe_voice(short_name: Optional[str]) -> str:
+def _describe_voice(short_name: Optional[str]) -> str:
     if not short_name:
         return "Voice: unavailable."
     voice = VOICES_BY_NAME.get(short_name)
@@ -602,12 +910,10 @@ def describe_voice(short_name: Optional[str]) -> str:
 
 
 def describe_default_voice(language_code: str) -> str:
-    option = LANGUAGE_OPTIONS.get(language_code)
-    default_voice = option.voices[0].short_name if option and option.voices else None
-    return describe_voice(default_voice)
+    return describe_voice(DEFAULT_VOICE_BY_LANG.get(language_code))
 
 
-def render_language_card(code: str) -> str:
+def _render_language_card(code: str) -> str:
     option = LANGUAGE_OPTIONS.get(code)
     if not option:
         return (
@@ -620,25 +926,22 @@ def render_language_card(code: str) -> str:
     locales = ", ".join(option.locales) if option.locales else "n/a"
     voice_count = len(option.voices)
 
-    card_parts = [
-        "<div class='info-card'>",
-        f"<div class='info-card__title'>{option.name} — {option.code}</div>",
-    ]
-    if option.native_name and option.native_name.lower() != option.name.lower():
-        card_parts.append(
-            f"<div class='info-card__subtitle'>{option.native_name}</div>"
-        )
-    card_parts.extend(
-        [
-            f"<div class='info-card__meta'><span>STT Locales:</span> {locales}</div>",
-            f"<div class='info-card__meta'><span>Voices available:</span> {voice_count}</div>",
-            "</div>",
-        ]
+    subtitle = (
+        f"<div class='info-card__subtitle'>{option.native_name}</div>"
+        if option.native_name and option.native_name.lower() != option.name.lower()
+        else ""
+    )
+    return (
+        "<div class='info-card'>"
+        f"<div class='info-card__title'>{option.name} — {option.code}</div>"
+        f"{subtitle}"
+        f"<div class='info-card__meta'><span>STT Locales:</span> {locales}</div>"
+        f"<div class='info-card__meta'><span>Voices available:</span> {voice_count}</div>"
+        "</div>"
     )
-    return "".join(card_parts)
 
 
-def render_voice_card(short_name: Optional[str]) -> str:
+def _render_voice_card(short_name: Optional[str]) -> str:
     if not short_name:
         return (
             "<div class='info-card'>"
@@ -662,7 +965,7 @@ def render_voice_card(short_name: Optional[str]) -> str:
     )
 
 
-def render_selected_voice(short_name: Optional[str]) -> str:
+def _render_selected_voice(short_name: Optional[str]) -> str:
     if not short_name:
         return "<div class='selected-voice'><span>Selected voice:</span> unavailable.</div>"
     voice = VOICES_BY_NAME.get(short_name)
@@ -680,7 +983,7 @@ def render_selected_voice(short_name: Optional[str]) -> str:
     )
 
 
-def render_default_voice_label(short_name: Optional[str]) -> str:
+def _render_default_voice_label(short_name: Optional[str]) -> str:
     if not short_name:
         return "<div class='default-voice'>Default voice: unavailable.</div>"
     return (
@@ -688,10 +991,95 @@ def render_default_voice_label(short_name: Optional[str]) -> str:
     )
 
 
-def render_default_voice_views(language_code: str) -> Tuple[str, str, str]:
-    option = LANGUAGE_OPTIONS.get(language_code)
-    default_voice = option.voices[0].short_name if option and option.voices else None
+# Catalog-derived descriptions never change at runtime, so load_catalog()
+# renders them once and they are looked up by language code or voice short name.
+LANG_DESC_HTML: Dict[str, str] = {}
+LANG_CARD_HTML: Dict[str, str] = {}
+VOICE_DESC_TEXT: Dict[str, str] = {}
+VOICE_CARD_HTML: Dict[str, str] = {}
+VOICE_SUMMARY_HTML: Dict[str, str] = {}
+VOICE_LABEL_HTML: Dict[str, str] = {}
+
+_catalog_lock = threading.Lock()
+_catalog_loaded = False
+
+
+def load_catalog() -> None:
+    """
+    Loads the language/voice catalog and fills the module tables. build_interface()
+    calls it; code driving the controller directly must call it first. Idempotent.
+    """
+    global _catalog_loaded
+    with _catalog_lock:
+        if _catalog_loaded:
+            return
+        languages, voices = _cached_language_options()
+        LANGUAGE_OPTIONS.update(languages)
+        VOICES_BY_NAME.update(voices)
+        SORTED_LANGUAGE_OPTIONS.extend(
+            sorted(LANGUAGE_OPTIONS.values(), key=lambda opt: opt.name.lower())
+        )
+        LANGUAGE_ITEMS.extend((option.name, option.code) for option in SORTED_LANGUAGE_OPTIONS)
+        for code, option in LANGUAGE_OPTIONS.items():
+            choices = [voice.short_name for voice in option.voices]
+            VOICE_CHOICES_BY_LANG[code] = choices
+            DEFAULT_VOICE_BY_LANG[code] = choices[0] if choices else None
+            LANG_DESC_HTML[code] = _describe_language(code)
+            LANG_CARD_HTML[code] = _render_language_card(code)
+        for name in VOICES_BY_NAME:
+            VOICE_DESC_TEXT[name] = _describe_voice(name)
+            VOICE_CARD_HTML[name] = _render_voice_card(name)
+            VOICE_SUMMARY_HTML[name] = _render_selected_voice(name)
+            VOICE_LABEL_HTML[name] = _render_default_voice_label(name)
+        _catalog_loaded = True
+
+
+def describe_language(code: str) -> str:
+    html = LANG_DESC_HTML.get(code)
+    return html if html is not None else _describe_language(code)
+
+
+def describe_voice(short_name: Optional[str]) -> str:
+    text = VOICE_DESC_TEXT.get(short_name)
+    return text if text is not None else _describe_voice(short_name)
+
+
+def render_language_card(code: str) -> str:
+    html = LANG_CARD_HTML.get(code)
+    return html if html is not None else _render_language_card(code)
+
+
+def render_voice_card(short_name: Optional[str]) -> str:
+    html = VOICE_CARD_HTML.get(short_name)
+    return html if html is not None else _render_voice_card(short_name)
+
+
+def render_selected_voice(short_name: Optional[str]) -> str:
+    html = VOICE_SUMMARY_HTML.get(short_name)
+    return html if html is not None else _render_selected_voice(short_name)
+
+
+def render_default_voice_label(short_name: Optional[str]) -> str:
+    html = VOICE_LABEL_HTML.get(short_name)
+    return html if html is not None else _render_default_voice_label(short_name)
+
+
+def on_target_change(language_code: str, shown_target: str):
+    """Refreshes the target card, voice picker and default-voice views in one event."""
+    # Programmatic writes fire change too; skip when the views already match
+    if language_code == shown_target:
+        return (_gr_update(), shown_target) + (_gr_update(),) * 4
+    default_voice = DEFAULT_VOICE_BY_LANG.get(language_code)
+    if default_voice is None:
+        voice_update = _gr_update(choices=[], value=None, interactive=False)
+    else:
+        voice_update = _gr_update(
+            choices=VOICE_CHOICES_BY_LANG[language_code], value=default_voice, interactive=True
+        )
     return (
+        render_language_card(language_code),
+        language_code,
+        voice_update,
         render_voice_card(default_voice),
         render_selected_voice(default_voice),
         render_default_voice_label(default_voice),
@@ -702,8 +1090,26 @@ def render_voice_views(short_name: Optional[str]) -> Tuple[str, str]:
     return render_voice_card(short_name), render_selected_voice(short_name)
 
 
-def get_logo_source() -> str:
-    logo_path = Path(__file__).resolve().parent / "download.png"
+def on_source_change(
+    source_lang: str, target_lang: str, voice_name: Optional[str], shown_source: str
+):
+    # Programmatic writes fire change too; skip when the card already matches
+    if source_lang == shown_source:
+        return _gr_update(), shown_source
+    controller.resolve(source_lang, target_lang, voice_name)
+    return render_language_card(source_lang), source_lang
+
+
+def on_voice_change(
+    source_lang: str, target_lang: str, voice_name: Optional[str]
+) -> Tuple[str, str]:
+    # Also fires after a target change, since that resets the voice dropdown
+    controller.resolve(source_lang, target_lang, voice_name)
+    return render_voice_views(voice_name)
+
+
+def _compute_logo_source() -> str:
+    logo_path = _MODULE_DIR / "download.png"
     if logo_path.exists():
         try:
             encoded_logo = base64.b64encode(logo_path.read_bytes()).decode("ascii")
@@ -713,6 +1119,10 @@ def get_logo_source() -> str:
     return "file=download.png"
 
 
+# The logo never changes at runtime; encode it once.
+LOGO_SOURCE = _compute_logo_source()
+
+
 def apply_settings(
     source_lang: str,
     target_lang: str,
@@ -752,34 +1162,12 @@ def handle_silence_change(
     return f"Silence duration set to {silence_seconds:.1f}s (applies on next start)."
 
 
-def build_interface():
-    language_options = sorted(
-        LANGUAGE_OPTIONS.values(), key=lambda opt: opt.name.lower()
-    )
-    if not language_options:
-        raise RuntimeError("Azure metadata did not return any languages.")
-
-    language_items = [(option.name, option.code) for option in language_options]
-    language_codes = [code for _, code in language_items]
-
-    default_source_code = (
-        DEFAULT_SOURCE if LANGUAGE_OPTIONS.get(DEFAULT_SOURCE) else language_codes[0]
-    )
-    default_target_code = (
-        DEFAULT_TARGET if LANGUAGE_OPTIONS.get(DEFAULT_TARGET) else language_codes[0]
-    )
-
-    target_option = LANGUAGE_OPTIONS.get(default_target_code)
-    voice_choices = (
-        [voice.short_name for voice in target_option.voices] if target_option else []
-    )
-    default_voice = voice_choices[0] if voice_choices else None
-
-    theme_path = Path(__file__).resolve().parent / "custom_theme.css"
+@functools.lru_cache(maxsize=1)
+def _css() -> str:
+    theme_path = _MODULE_DIR / "custom_theme.css"
     if theme_path.exists():
-        custom_css = theme_path.read_text(encoding="utf-8")
-    else:
-        custom_css = """
+        return theme_path.read_text(encoding="utf-8")
+    return """
 :root {
     --protiviti-blue-900: #1B4E8E;
     --protiviti-blue-800: #254B73;
@@ -1124,10 +1512,28 @@ body,
 }
         """
 
+
+def build_interface():
+    # Imported here so using the controller alone does not pay Gradio's import cost.
+    import audio_compat  # noqa: F401  # must precede gradio: registers audioop on 3.13+
+    import gradio as gr
+
+    load_catalog()
+    if not SORTED_LANGUAGE_OPTIONS:
+        raise RuntimeError("Azure metadata did not return any languages.")
+
+    fallback_option = SORTED_LANGUAGE_OPTIONS[0]
+    default_source_code = LANGUAGE_OPTIONS.get(DEFAULT_SOURCE, fallback_option).code
+    default_target_code = LANGUAGE_OPTIONS.get(DEFAULT_TARGET, fallback_option).code
+
+    voice_choices = VOICE_CHOICES_BY_LANG.get(default_target_code, [])
+    default_voice = DEFAULT_VOICE_BY_LANG.get(default_target_code)
+
+    custom_css = _css()
+
     default_voice_label = render_default_voice_label(default_voice)
     initial_voice_card = render_voice_card(default_voice)
     initial_voice_summary = render_selected_voice(default_voice)
-    logo_source = get_logo_source()
 
     with gr.Blocks(
         title="Speech to Speech Translator",
@@ -1142,7 +1548,7 @@ body,
                         <p>Real-time Silero VAD -> Azure STT -> Azure Translator -> Azure TTS</p>
                     </div>
                     <div class="top-bar__logo">
-                        <img src="{logo_source}" alt="Protiviti logo" class="logo"/>
+                        <img src="{LOGO_SOURCE}" alt="Protiviti logo" class="logo"/>
                     </div>
                 </div>
                 """
@@ -1159,14 +1565,14 @@ body,
                 )
                 with gr.Row(elem_classes=["language-row"]):
                     source_dropdown = gr.Dropdown(
-                        choices=language_items,
+                        choices=LANGUAGE_ITEMS,
                         value=default_source_code,
                         label="Source language (translation code)",
                         interactive=True,
                         elem_classes=["control-input"],
                     )
                     target_dropdown = gr.Dropdown(
-                        choices=language_items,
+                        choices=LANGUAGE_ITEMS,
                         value=default_target_code,
                         label="Target language (translation code)",
                         interactive=True,
@@ -1279,29 +1685,29 @@ body,
                     elem_classes=["output-field"],
                 )
 
+        # Language code each info card currently shows
+        shown_source = gr.State(default_source_code)
+        shown_target = gr.State(default_target_code)
         source_dropdown.change(
-            fn=render_language_card,
-            inputs=source_dropdown,
-            outputs=source_info,
+            fn=on_source_change,
+            inputs=[source_dropdown, target_dropdown, voice_dropdown, shown_source],
+            outputs=[source_info, shown_source],
         )
         target_dropdown.change(
-            fn=render_language_card,
-            inputs=target_dropdown,
-            outputs=target_info,
-        )
-        target_dropdown.change(
-            fn=update_voices,
-            inputs=target_dropdown,
-            outputs=voice_dropdown,
-        )
-        target_dropdown.change(
-            fn=render_default_voice_views,
-            inputs=target_dropdown,
-            outputs=[voice_info, voice_summary, default_voice_display],
+            fn=on_target_change,
+            inputs=[target_dropdown, shown_target],
+            outputs=[
+                target_info,
+                shown_target,
+                voice_dropdown,
+                voice_info,
+                voice_summary,
+                default_voice_display,
+            ],
         )
         voice_dropdown.change(
-            fn=render_voice_views,
-            inputs=voice_dropdown,
+            fn=on_voice_change,
+            inputs=[source_dropdown, target_dropdown, voice_dropdown],
             outputs=[voice_info, voice_summary],
         )
 
@@ -1334,7 +1740,7 @@ body,
             outputs=status_box,
         )
 
-        silence_slider.change(
+        silence_slider.release(
             fn=handle_silence_change,
             inputs=[
                 source_dropdown,
@@ -1345,15 +1751,19 @@ body,
             outputs=status_box,
         )
 
+        # One long-lived stream per browser session, so the limit has to be well
+        # above the default of 1 without leaving thread use unbounded.
         demo.load(
-            fn=refresh_outputs,
+            fn=stream_outputs,
             outputs=[log_box, transcription_box, translation_box, status_box],
-            every=1.0,
+            concurrency_limit=MAX_UI_STREAMS,
         )
 
     return demo
 
 
 if __name__ == "__main__":
+    load_dotenv()
+    enable_console_logging()
     app = build_interface()
     app.launch()